@@ -8,6 +8,7 @@ automatic retry on transient errors (429, 502, 503, 504).
 from __future__ import annotations
 
 import asyncio
+import os
 from typing import Any
 
 from loguru import logger
@@ -23,8 +24,20 @@ from tenacity import (
 
 from planecli.api.client import get_config
 
+_DEFAULT_CONCURRENCY = 4
+
+
+def api_concurrency() -> int:
+    """Max concurrent API calls: PLANECLI_CONCURRENCY if a positive int, else 4."""
+    try:
+        value = int(os.environ.get("PLANECLI_CONCURRENCY", ""))
+    except ValueError:
+        return _DEFAULT_CONCURRENCY
+    return value if value > 0 else _DEFAULT_CONCURRENCY
+
+
 # Limit concurrent API calls to prevent rate limiting
-_api_semaphore = asyncio.Semaphore(4)
+_api_semaphore = asyncio.Semaphore(api_concurrency())
 
 
 def _is_retryable(exc: BaseException) -> bool:
@@ -12,6 +12,7 @@ from planecli.api.async_sdk import run_sdk
 from planecli.api.client import get_client, get_workspace, handle_api_error
 from planecli.exceptions import PlaneCLIError
 from planecli.formatters import output, output_single
+from planecli.utils.html import strip_html
 from planecli.utils.resolve import (
     resolve_work_item_across_projects_async,
     resolve_work_item_async,
@@ -47,8 +48,7 @@ def _enrich_comment(data: dict, members_map: dict[str, str] | None = None) -> di
     # Strip HTML from comment body
     body_html = data.get("comment_html") or ""
     if body_html:
-        import re
-        data["body_text"] = re.sub(r"<[^>]+>", "", body_html).strip()
+        data["body_text"] = strip_html(body_html)
     else:
         data["body_text"] = ""
 
@@ -12,6 +12,7 @@ from plane.errors import PlaneError
 from planecli.api.async_sdk import run_sdk
 from planecli.api.client import get_client, get_workspace, handle_api_error
 from planecli.formatters import output, output_single
+from planecli.utils.html import strip_html
 from planecli.utils.resolve import resolve_project_async
 
 doc_app = cyclopts.App(
@@ -39,8 +40,7 @@ def _enrich_doc(data: dict) -> dict:
     """Add convenience fields to a document dict."""
     desc_html = data.get("description_html") or ""
     if desc_html:
-        import re
-        data["content_text"] = re.sub(r"<[^>]+>", "", desc_html).strip()
+        data["content_text"] = strip_html(desc_html)
     else:
         data["content_text"] = ""
     return data
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Annotated
+import heapq
+import itertools
+from typing import Annotated, Any
 
 import cyclopts
 from cyclopts import Parameter
@@ -11,13 +13,16 @@ from loguru import logger
 from plane.errors import PlaneError
 from rich.text import Text
 
-from planecli.api.async_sdk import create_client, run_sdk
+from planecli.api.async_sdk import run_sdk
 from planecli.api.client import get_client, get_workspace, handle_api_error
+from planecli.exceptions import PlaneCLIError, ValidationError
 from planecli.formatters import output, output_single
 from planecli.utils.colors import PRIORITY_COLORS, colorize, lighten_hex
+from planecli.utils.html import strip_html
 from planecli.utils.resolve import (
+    ISSUE_ID_PATTERN,
     resolve_estimate_point_async,
-    resolve_label_async,
+    resolve_labels_async,
     resolve_module_async,
     resolve_project_async,
     resolve_state_async,
@@ -57,6 +62,33 @@ WI_FIELDS = [
     ("updated_at", "Updated"),
 ]
 
+# Numeric shorthands accepted by --priority (Plane's priority order)
+_PRIORITY_MAP = {"0": "none", "1": "urgent", "2": "high", "3": "medium", "4": "low"}
+
+
+def _state_display_color(color: str | None, group: str | None) -> str | None:
+    """Return the color to render a state with.
+
+    "unstarted" group colors (e.g. Todo) are lightened to distinguish them from "backlog".
+    """
+    if color and group == "unstarted":
+        return lighten_hex(color)
+    return color
+
+
+def _label_part(
+    label: dict | str, label_map: dict[str, dict[str, str | None]] | None
+) -> str | Text:
+    """Return the (colorized) name for an expanded label or a label UUID."""
+    if isinstance(label, dict):
+        return colorize(label.get("name", ""), label.get("color"))
+    if isinstance(label, str):
+        if label_map and label in label_map:
+            info = label_map[label]
+            return colorize(info["name"] or "", info.get("color"))
+        return label
+    return ""
+
 
 def _enrich_work_item(
     data: dict,
@@ -70,13 +102,15 @@ def _enrich_work_item(
 
     Args:
         data: Work item dict from model_dump().
-        state_map: Optional UUID->{"name": str, "color": str|None} mapping for states.
+        state_map: Optional UUID->state info mapping for states (see _build_state_map).
         member_map: Optional UUID->display_name mapping for workspace members.
         label_map: Optional UUID->{"name": str, "color": str|None} mapping for labels.
         project_identifier: Optional project identifier (e.g. "CHATFIN") for sequence IDs.
+            When None, it is read from the item's expanded project_detail.
     """
-    # Add sequence_id like CHATFIN-30
-    if not project_identifier:
+    # Add sequence_id like CHATFIN-30. Callers that already know the project
+    # (e.g. list_) pass project_identifier, skipping the project_detail lookup.
+    if project_identifier is None:
         project_detail = data.get("project_detail")
         project_identifier = (
             project_detail.get("identifier", "")
@@ -95,20 +129,14 @@ def _enrich_work_item(
         data["priority"] = ""
 
     # State name - try expanded object first, then lookup map, then raw value
-    # Lighten "unstarted" group colors (e.g. Todo) to distinguish from "backlog"
     state_detail = data.get("state_detail") or data.get("state")
     if isinstance(state_detail, dict):
         state_name = state_detail.get("name", "")
-        state_color = state_detail.get("color")
-        if state_color and state_detail.get("group") == "unstarted":
-            state_color = lighten_hex(state_color)
+        state_color = _state_display_color(state_detail.get("color"), state_detail.get("group"))
         data["state_detail_name"] = colorize(state_name, state_color)
     elif isinstance(state_detail, str) and state_map and state_detail in state_map:
         info = state_map[state_detail]
-        state_color = info.get("color")
-        if state_color and info.get("group") == "unstarted":
-            state_color = lighten_hex(state_color)
-        data["state_detail_name"] = colorize(info["name"] or "", state_color)
+        data["state_detail_name"] = colorize(info["name"] or "", info.get("display_color"))
     elif isinstance(state_detail, str):
         data["state_detail_name"] = state_detail
     else:
@@ -117,45 +145,31 @@ def _enrich_work_item(
     # Assignee names - try expanded objects first, then lookup map
     assignees = data.get("assignees") or data.get("assignee_detail") or []
     if isinstance(assignees, list):
-        names = []
-        for a in assignees:
-            if isinstance(a, dict):
-                names.append(a.get("display_name") or a.get("first_name", ""))
-            elif isinstance(a, str) and member_map and a in member_map:
-                names.append(member_map[a])
-            elif isinstance(a, str):
-                names.append(a[:8])  # Show truncated UUID as fallback
-        data["assignee_names"] = ", ".join(names) if names else ""
+        members = member_map or {}
+        names = [
+            (a.get("display_name") or a.get("first_name", "")) if isinstance(a, dict)
+            # Show truncated UUID as fallback for unknown members
+            else (members[a] if a in members else a[:8]) if isinstance(a, str)
+            else ""
+            for a in assignees
+        ]
+        data["assignee_names"] = ", ".join(filter(None, names))
     else:
         data["assignee_names"] = ""
 
     # Label names - try expanded objects first, then lookup map (with per-label colors)
     labels = data.get("labels") or data.get("label_detail") or []
     if isinstance(labels, list):
-        label_parts: list[str | Text] = []
-        for lbl in labels:
-            if isinstance(lbl, dict):
-                label_parts.append(
-                    colorize(lbl.get("name", ""), lbl.get("color"))
-                )
-            elif isinstance(lbl, str) and label_map and lbl in label_map:
-                info = label_map[lbl]
-                label_parts.append(
-                    colorize(info["name"] or "", info.get("color"))
-                )
-            elif isinstance(lbl, str):
-                label_parts.append(lbl)
+        label_parts: list[str | Text] = list(
+            filter(None, (_label_part(lbl, label_map) for lbl in labels))
+        )
         if label_parts:
-            combined = Text()
-            for i, part in enumerate(label_parts):
-                if i > 0:
-                    combined.append(", ")
-                if isinstance(part, Text):
-                    combined.append_text(part)
-                else:
-                    combined.append(str(part))
-            data["label_names"] = combined
-            data["label_detail_names"] = [str(part) for part in label_parts]
+            data["label_names"] = Text(", ").join(
+                part if isinstance(part, Text) else Text(part) for part in label_parts
+            )
+            data["label_detail_names"] = [
+                part.plain if isinstance(part, Text) else part for part in label_parts
+            ]
         else:
             data["label_names"] = ""
             data["label_detail_names"] = []
@@ -166,9 +180,7 @@ def _enrich_work_item(
     # Description stripped
     desc_html = data.get("description_html") or ""
     if desc_html:
-        import re
-
-        data["description_stripped"] = re.sub(r"<[^>]+>", "", desc_html).strip()
+        data["description_stripped"] = strip_html(desc_html)
 
     # Estimate display - handle expanded dict, raw UUID, or None
     ep = data.get("estimate_point")
@@ -182,10 +194,47 @@ def _enrich_work_item(
     return data
 
 
+# Lookup-map builders for list_: one map per fetched resource list, reused
+# across every work item of that project.
+def _build_member_map(members: list[dict]) -> dict[str, str]:
+    """Build a member UUID -> display name map from cached member dicts."""
+    return {
+        m["id"]: (
+            f"{m.get('first_name') or ''} {m.get('last_name') or ''}".strip()
+            or m.get("display_name", "")
+        )
+        for m in members
+        if m.get("id")
+    }
+
+
+def _build_state_map(states: list[dict]) -> dict[str, dict[str, str | None]]:
+    """Build a state UUID -> {"name", "color", "group", "display_color"} map.
+
+    display_color is resolved here, once per state, so enriching each work item
+    is a plain lookup instead of a per-item lighten_hex call.
+    """
+    return {
+        s["id"]: {
+            "name": s.get("name"),
+            "color": s.get("color"),
+            "group": s.get("group"),
+            "display_color": _state_display_color(s.get("color"), s.get("group")),
+        }
+        for s in states if s.get("id") and s.get("name")
+    }
+
+
+def _build_label_map(labels: list[dict]) -> dict[str, dict[str, str | None]]:
+    """Build a label UUID -> {"name", "color"} map from cached label dicts."""
+    return {
+        lb["id"]: {"name": lb.get("name"), "color": lb.get("color")}
+        for lb in labels if lb.get("id") and lb.get("name")
+    }
+
+
 async def _resolve_project_id_async(project: str | None) -> str:
     """Resolve project flag to a project UUID (async)."""
-    from planecli.exceptions import ValidationError
-
     if not project:
         raise ValidationError(
             "Project is required for this command.",
@@ -197,8 +246,23 @@ async def _resolve_project_id_async(project: str | None) -> str:
     return resolved["id"]
 
 
+async def _resolve_work_item_with_project(
+    issue: str, project: str | None, client, workspace: str
+) -> tuple[dict, str]:
+    """Resolve a work item reference and its project UUID.
+
+    Identifiers (ABC-123) are fetched from the workspace-scoped endpoint, which
+    already returns the item's project, so --project is not resolved for them.
+    """
+    if project and not ISSUE_ID_PATTERN.match(issue):
+        project_id = await _resolve_project_id_async(project)
+        item_data = await resolve_work_item_async(issue, client, workspace, project_id)
+        return item_data, project_id
+    return await resolve_work_item_across_projects_async(issue, client, workspace)
+
+
 async def _fetch_project_data(
-    client, workspace: str, project_id: str
+    workspace: str, project_id: str
 ) -> tuple[list[dict], list[dict], list[dict]]:
     """Fetch work items, states, and labels for a project in parallel.
 
@@ -250,56 +314,83 @@ async def list_(
         client = get_client()
         workspace = get_workspace()
 
-        # Workspace-scoped: fetch members once (cached)
         from planecli.cache import cached_list_members, cached_list_projects
 
-        members = await cached_list_members(workspace)
-        member_map = {}
-        for m in members:
-            if not m.get("id"):
-                continue
-            full_name = " ".join(
-                p for p in [m.get("first_name", ""), m.get("last_name", "")]
-                if p
-            )
-            member_map[m["id"]] = full_name or m.get("display_name", "")
+        async def _projects() -> list[dict]:
+            if project:
+                return [await resolve_project_async(project, client, workspace)]
+            return await cached_list_projects(workspace)
 
-        if project:
-            proj = await resolve_project_async(project, client, workspace)
-            projects_to_list = [proj]
-        else:
-            projects_to_list = await cached_list_projects(workspace)
+        # Workspace-scoped members (cached) don't depend on the projects: fetch both at once
+        members, projects_to_list = await asyncio.gather(
+            cached_list_members(workspace), _projects()
+        )
+        member_map = _build_member_map(members)
+
+        # Resolve filter targets up front so each project's items can be filtered
+        # as soon as that project finishes, instead of after merging everything.
+        user_id = None
+        if assignee:
+            user = await resolve_user_async(assignee, client, workspace)
+            user_id = user["id"]
+
+        parent_id = None
+        if parent:
+            if project:
+                parent_data = await resolve_work_item_async(
+                    parent, client, workspace, projects_to_list[0]["id"]
+                )
+            else:
+                parent_data, _ = await resolve_work_item_across_projects_async(
+                    parent, client, workspace
+                )
+            parent_id = parent_data["id"]
+
+        # Comma-separated, OR logic, substring match
+        state_tokens = [s.strip().lower() for s in (state or "").split(",") if s.strip()]
+        label_tokens = [ln.strip().lower() for ln in (labels or "").split(",") if ln.strip()]
+
+        def _matches_filters(d: dict) -> bool:
+            # Cheapest checks first so most misses return before any string work
+            if parent_id is not None and d.get("parent") != parent_id:
+                return False
+            if user_id is not None:
+                assignees = d.get("assignees") or []
+                if user_id not in assignees and not any(
+                    isinstance(a, dict) and a.get("id") == user_id for a in assignees
+                ):
+                    return False
+            if state_tokens:
+                state_name = str(d.get("state_detail_name") or "").lower()
+                if not any(token in state_name for token in state_tokens):
+                    return False
+            if label_tokens:
+                # Lowercase once per item; NUL can't occur in CLI args, so a
+                # token never matches across two label names.
+                joined = "\0".join(d.get("label_detail_names") or []).lower()
+                if not any(token in joined for token in label_tokens):
+                    return False
+            return True
 
         # Fetch all projects in parallel (each project fetches items+states+labels in parallel)
-        data = []
+        matched: list[list[dict]] = []
         if projects_to_list:
-            # Use fresh client instances for parallel project fetching
+            # The cached fetchers create their own client on a cache miss, so
+            # parallel projects don't need one here.
             async def _fetch_and_enrich(proj_dict: dict) -> list[dict]:
-                proj_client = create_client()
                 project_id = proj_dict["id"]
                 proj_identifier = proj_dict.get("identifier", "")
 
-                items, states, labels_list = await _fetch_project_data(
-                    proj_client, workspace, project_id
-                )
+                items, states, labels_list = await _fetch_project_data(workspace, project_id)
 
                 if not items:
                     return []
 
                 # states and labels are already dicts (from cache)
-                state_map = {
-                    s["id"]: {
-                        "name": s.get("name"),
-                        "color": s.get("color"),
-                        "group": s.get("group"),
-                    }
-                    for s in states if s.get("id") and s.get("name")
-                }
-                label_map = {
-                    lb["id"]: {"name": lb.get("name"), "color": lb.get("color")}
-                    for lb in labels_list if lb.get("id") and lb.get("name")
-                }
+                state_map = _build_state_map(states)
+                label_map = _build_label_map(labels_list)
 
+                # Filter while enriching so only matching items outlive this project
                 enriched_items = []
                 for i in items:
                     item_dict = i if isinstance(i, dict) else i.model_dump()
@@ -311,7 +402,8 @@ async def list_(
                         project_identifier=proj_identifier,
                     )
                     enriched["project_identifier"] = proj_identifier
-                    enriched_items.append(enriched)
+                    if _matches_filters(enriched):
+                        enriched_items.append(enriched)
                 return enriched_items
 
             results = await asyncio.gather(
@@ -330,74 +422,18 @@ async def list_(
                         f"{proj_dict.get('identifier', proj_dict['id'])}: {result}[/]"
                     )
                     continue
-                data.extend(result)
+                matched.append(result)
     except PlaneError as e:
         raise handle_api_error(e)
 
-    # Filter by assignee
-    if assignee:
-        user = await resolve_user_async(assignee, client, workspace)
-        user_id = user["id"]
-        data = [
-            d for d in data
-            if user_id in (d.get("assignees") or [])
-            or any(
-                (isinstance(a, dict) and a.get("id") == user_id)
-                for a in (d.get("assignees") or [])
-            )
-        ]
-
-    # Filter by state (comma-separated, OR logic, substring match)
-    if state:
-        state_tokens = [s.strip().lower() for s in state.split(",") if s.strip()]
-        if state_tokens:
-            data = [
-                d for d in data
-                if any(
-                    token in str(d.get("state_detail_name") or "").lower()
-                    for token in state_tokens
-                )
-            ]
-
-    # Filter by parent work item
-    if parent:
-        if project:
-            project_id = projects_to_list[0]["id"] if projects_to_list else None
-            if project_id:
-                parent_data = await resolve_work_item_async(
-                    parent, client, workspace, project_id
-                )
-            else:
-                parent_data, _ = await resolve_work_item_across_projects_async(
-                    parent, client, workspace
-                )
-        else:
-            parent_data, _ = await resolve_work_item_across_projects_async(
-                parent, client, workspace
-            )
-        parent_id = parent_data["id"]
-        data = [d for d in data if d.get("parent") == parent_id]
-
-    # Filter by labels (comma-separated, OR logic, substring match)
-    if labels:
-        label_tokens = [ln.strip().lower() for ln in labels.split(",") if ln.strip()]
-        if label_tokens:
-            data = [
-                d for d in data
-                if any(
-                    token in name.lower()
-                    for token in label_tokens
-                    for name in (d.get("label_detail_names") or [])
-                )
-            ]
-
-    # Sort
-    if sort == "updated":
-        data.sort(key=lambda x: x.get("updated_at") or "", reverse=True)
-    else:
-        data.sort(key=lambda x: x.get("created_at") or "", reverse=True)
-
-    data = data[:limit]
+    # Sort newest first and keep the top `limit` items. nlargest computes each key
+    # once and only keeps `limit` items in its heap instead of sorting everything.
+    sort_field = "updated_at" if sort == "updated" else "created_at"
+    data = heapq.nlargest(
+        limit,
+        itertools.chain.from_iterable(matched),
+        key=lambda x: x.get(sort_field) or "",
+    )
     columns = WI_COLUMNS
     output(data, columns, title="Work Items", as_json=json)
 
@@ -451,7 +487,6 @@ async def show(
     # (ADR-0006) instead of hitting the outer handler and aborting the command.
     if not no_comments and data.get("id") and data.get("project"):
         from planecli.commands.comments import fetch_issue_comments
-        from planecli.exceptions import PlaneCLIError
         try:
             data["comments"] = await fetch_issue_comments(
                 workspace, data["project"], data["id"]
@@ -538,23 +573,23 @@ async def create(
         project_id = parallel_results[0]
         idx = 1
 
-        create_data = CreateWorkItem(name=title)
+        # Collect fields in a plain dict; the model is built once before the call
+        create_fields: dict[str, Any] = {"name": title}
 
         if description:
-            create_data.description_html = f"<p>{description}</p>"
+            create_fields["description_html"] = f"<p>{description}</p>"
 
         if priority:
-            priority_map = {"0": "none", "1": "urgent", "2": "high", "3": "medium", "4": "low"}
-            create_data.priority = priority_map.get(priority, priority.lower())
+            create_fields["priority"] = _PRIORITY_MAP.get(priority, priority.lower())
 
         if assignee:
             user = parallel_results[idx]
-            create_data.assignees = [user["id"]]
+            create_fields["assignees"] = [user["id"]]
             idx += 1
 
         if parent:
             parent_data, _ = parallel_results[idx]
-            create_data.parent = parent_data["id"]
+            create_fields["parent"] = parent_data["id"]
             idx += 1
 
         # Resolve state, labels, and estimate (depend on project_id) in parallel
@@ -570,28 +605,26 @@ async def create(
                 resolve_estimate_point_async(str(estimate), workspace, project_id)
             )
             dep_keys.append("estimate")
-        if labels:
-            label_names = [ln.strip() for ln in labels.split(",") if ln.strip()]
-            for ln in label_names:
-                dependent_tasks.append(
-                    resolve_label_async(ln, client, workspace, project_id)
-                )
-                dep_keys.append("label")
+        label_names = [ln.strip() for ln in (labels or "").split(",") if ln.strip()]
+        if label_names:
+            dependent_tasks.append(
+                resolve_labels_async(label_names, client, workspace, project_id)
+            )
+            dep_keys.append("labels")
 
         if dependent_tasks:
             dep_results = await asyncio.gather(*dependent_tasks)
-            label_ids = []
             for key, result in zip(dep_keys, dep_results):
                 if key == "state":
-                    create_data.state = result["id"]
+                    create_fields["state"] = result["id"]
                 elif key == "estimate":
-                    create_data.estimate_point = result["id"]
-                elif key == "label":
-                    label_ids.append(result["id"])
-            if label_ids:
-                create_data.labels = label_ids
+                    create_fields["estimate_point"] = result["id"]
+                elif key == "labels":
+                    create_fields["labels"] = [lb["id"] for lb in result]
 
-        item = await run_sdk(client.work_items.create, workspace, project_id, create_data)
+        item = await run_sdk(
+            client.work_items.create, workspace, project_id, CreateWorkItem(**create_fields)
+        )
         data = _enrich_work_item(item.model_dump())
 
         # Invalidate work items cache for this project
@@ -660,26 +693,22 @@ async def update(
         workspace = get_workspace()
 
         # Resolve the work item
-        if project:
-            project_id = await _resolve_project_id_async(project)
-            item_data = await resolve_work_item_async(issue, client, workspace, project_id)
-        else:
-            item_data, project_id = await resolve_work_item_across_projects_async(
-                issue, client, workspace
-            )
+        item_data, project_id = await _resolve_work_item_with_project(
+            issue, project, client, workspace
+        )
 
         item_id = item_data["id"]
-        update_data = UpdateWorkItem()
+        # Collect fields in a plain dict; the model is built once before the call
+        update_fields: dict[str, Any] = {}
 
         if name:
-            update_data.name = name
+            update_fields["name"] = name
 
         if description:
-            update_data.description_html = f"<p>{description}</p>"
+            update_fields["description_html"] = f"<p>{description}</p>"
 
         if priority:
-            priority_map = {"0": "none", "1": "urgent", "2": "high", "3": "medium", "4": "low"}
-            update_data.priority = priority_map.get(priority, priority.lower())
+            update_fields["priority"] = _PRIORITY_MAP.get(priority, priority.lower())
 
         # Resolve assignee, state, labels, and estimate in parallel
         parallel_tasks = []
@@ -698,34 +727,34 @@ async def update(
                 resolve_estimate_point_async(str(estimate), workspace, project_id)
             )
             task_keys.append("estimate")
-        if labels and not clear_labels:
-            label_names = [ln.strip() for ln in labels.split(",") if ln.strip()]
-            for ln in label_names:
-                parallel_tasks.append(
-                    resolve_label_async(ln, client, workspace, project_id)
-                )
-                task_keys.append("label")
+        label_names = [ln.strip() for ln in (labels or "").split(",") if ln.strip()]
+        if label_names and not clear_labels:
+            parallel_tasks.append(
+                resolve_labels_async(label_names, client, workspace, project_id)
+            )
+            task_keys.append("labels")
 
         if parallel_tasks:
             results = await asyncio.gather(*parallel_tasks)
-            label_ids = []
             for key, result in zip(task_keys, results):
                 if key == "assignee":
-                    update_data.assignees = [result["id"]]
+                    update_fields["assignees"] = [result["id"]]
                 elif key == "state":
-                    update_data.state = result["id"]
+                    update_fields["state"] = result["id"]
                 elif key == "estimate":
-                    update_data.estimate_point = result["id"]
-                elif key == "label":
-                    label_ids.append(result["id"])
-            if labels and not clear_labels and label_ids:
-                update_data.labels = label_ids
+                    update_fields["estimate_point"] = result["id"]
+                elif key == "labels":
+                    update_fields["labels"] = [lb["id"] for lb in result]
 
         if clear_labels:
-            update_data.labels = []
+            update_fields["labels"] = []
 
         updated = await run_sdk(
-            client.work_items.update, workspace, project_id, item_id, update_data
+            client.work_items.update,
+            workspace,
+            project_id,
+            item_id,
+            UpdateWorkItem(**update_fields),
         )
         data = _enrich_work_item(updated.model_dump())
 
@@ -760,13 +789,9 @@ async def delete(
         client = get_client()
         workspace = get_workspace()
 
-        if project:
-            project_id = await _resolve_project_id_async(project)
-            item_data = await resolve_work_item_async(issue, client, workspace, project_id)
-        else:
-            item_data, project_id = await resolve_work_item_across_projects_async(
-                issue, client, workspace
-            )
+        item_data, project_id = await _resolve_work_item_with_project(
+            issue, project, client, workspace
+        )
 
         item_id = item_data["id"]
         item_name = item_data.get("name", item_id)
@@ -815,11 +840,20 @@ async def search(
         # Extract work items from search results
         items = []
         if isinstance(results_data, dict):
-            items = results_data.get("results", [])
+            items = results_data.get("results") or results_data.get("issues") or []
         elif isinstance(results_data, list):
             items = results_data
 
-        data = [_enrich_work_item(i if isinstance(i, dict) else i.model_dump()) for i in items]
+        # Search hits (WorkItemSearchItem) carry no state/assignees/labels to map;
+        # only the project identifier is worth surfacing.
+        data = []
+        for i in items:
+            item_dict = i if isinstance(i, dict) else i.model_dump()
+            data.append(
+                _enrich_work_item(
+                    item_dict, project_identifier=item_dict.get("project__identifier")
+                )
+            )
     except PlaneError as e:
         raise handle_api_error(e)
 
@@ -853,13 +887,9 @@ async def assign(
         client = get_client()
         workspace = get_workspace()
 
-        if project:
-            project_id = await _resolve_project_id_async(project)
-            item_data = await resolve_work_item_async(issue, client, workspace, project_id)
-        else:
-            item_data, project_id = await resolve_work_item_across_projects_async(
-                issue, client, workspace
-            )
+        item_data, project_id = await _resolve_work_item_with_project(
+            issue, project, client, workspace
+        )
 
         item_id = item_data["id"]
         user = await resolve_user_async(assignee, client, workspace)
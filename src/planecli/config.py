@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import re
 import stat
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,6 +18,10 @@ _FIELD_MAP = {
     "workspace": "PLANE_WORKSPACE",
 }
 
+# One key=value pair per line. Blank lines, "#" comments and lines without "="
+# don't match; the value keeps any "=" or "#" it contains.
+_KV_RE = re.compile(r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=(.*)$", re.MULTILINE)
+
 
 @dataclass
 class Config:
@@ -25,20 +30,20 @@ class Config:
     workspace: str
 
 
+def _parse_config_text(text: str) -> dict[str, str]:
+    """Parse key=value pairs, lowercasing keys and stripping quotes from values."""
+    return {
+        m.group(1).lower(): m.group(2).strip().strip('"').strip("'") for m in _KV_RE.finditer(text)
+    }
+
+
 def _read_config_file() -> dict[str, str]:
     """Read key=value pairs from ~/.plane_api."""
-    if not CONFIG_FILE.exists():
+    try:
+        text = CONFIG_FILE.read_text()
+    except FileNotFoundError:
         return {}
-    values: dict[str, str] = {}
-    for line in CONFIG_FILE.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, _, value = line.partition("=")
-        values[key.strip().lower()] = value.strip().strip('"').strip("'")
-    return values
+    return _parse_config_text(text)
 
 
 def save_config(base_url: str, api_key: str, workspace: str) -> None:
@@ -55,13 +60,16 @@ def load_config(
     workspace: str | None = None,
 ) -> Config:
     """Load config with precedence: explicit args > env vars > config file."""
-    file_values = _read_config_file()
-
-    resolved_base_url = base_url or os.environ.get("PLANE_BASE_URL") or file_values.get("base_url")
-    resolved_api_key = api_key or os.environ.get("PLANE_API_KEY") or file_values.get("api_key")
-    resolved_workspace = (
-        workspace or os.environ.get("PLANE_WORKSPACE") or file_values.get("workspace")
-    )
+    resolved_base_url = base_url or os.environ.get("PLANE_BASE_URL")
+    resolved_api_key = api_key or os.environ.get("PLANE_API_KEY")
+    resolved_workspace = workspace or os.environ.get("PLANE_WORKSPACE")
+
+    # Only touch ~/.plane_api when args and env vars leave something unset
+    if not (resolved_base_url and resolved_api_key and resolved_workspace):
+        file_values = _read_config_file()
+        resolved_base_url = resolved_base_url or file_values.get("base_url")
+        resolved_api_key = resolved_api_key or file_values.get("api_key")
+        resolved_workspace = resolved_workspace or file_values.get("workspace")
 
     if not resolved_base_url:
         raise AuthenticationError(
@@ -10,10 +10,51 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
+try:
+    import orjson
+except ImportError:  # optional: install the "fast" extra for a C JSON encoder
+    orjson = None
+
 console = Console(stderr=True)
 error_console = Console(stderr=True)
 
 
+def _write_json(data: Any) -> None:
+    """Write data to stdout as indented JSON, stringifying unknown types.
+
+    Uses orjson when it is installed: stdlib json drops to its pure-Python encoder
+    whenever ``indent`` is set, which dominates ``--json`` on large listings.
+    orjson's UTF-8 bytes go straight to the binary stdout buffer when there is one.
+    Payloads orjson rejects (e.g. tuple keys) fall back to stdlib json. The two
+    encoders differ only in edge cases API data does not hit: orjson writes NaN and
+    Infinity as null, floats in shortest form (1e-7, not 1e-07) and Enum members as
+    their value, where stdlib writes NaN/Infinity, 1e-07 and str(member).
+    """
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            pass
+        else:
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is None:
+                sys.stdout.write(payload.decode() + "\n")
+            else:
+                sys.stdout.flush()  # keep ordering with any text already written
+                buffer.write(payload + b"\n")
+                buffer.flush()
+            return
+    # dumps + one write: json.dump issues a write() per encoder chunk
+    sys.stdout.write(json.dumps(data, indent=2, default=str, ensure_ascii=False) + "\n")
+
+
 def _format_value(value: Any) -> str | Text:
     """Format a value for table display, prettifying timestamps.
 
@@ -23,10 +64,10 @@ def _format_value(value: Any) -> str | Text:
         return value
     if not value:
         return ""
-    s = str(value)
+    s = value if type(value) is str else str(value)
     # ISO timestamp like "2026-02-08T12:26:34.340901Z" -> "2026-02-08 12:26:34"
-    if len(s) >= 20 and s[10:11] == "T" and s.endswith("Z"):
-        return s[:19].replace("T", " ")
+    if len(s) >= 20 and s[10] == "T" and s[-1] == "Z":
+        return f"{s[:10]} {s[11:19]}"
     return s
 
 
@@ -46,8 +87,7 @@ def output(
         as_json: If True, output JSON to stdout instead of a table.
     """
     if as_json:
-        json.dump(list(data), sys.stdout, indent=2, default=str, ensure_ascii=False)
-        sys.stdout.write("\n")
+        _write_json(list(data))
         return
 
     table = Table(title=title, show_lines=True, padding=(0, 1))
@@ -77,8 +117,7 @@ def output_single(
         as_json: If True, output JSON to stdout instead of a table.
     """
     if as_json:
-        json.dump(data, sys.stdout, indent=2, default=str, ensure_ascii=False)
-        sys.stdout.write("\n")
+        _write_json(data)
         return
 
     table = Table(title=title, show_header=False, show_lines=True, padding=(0, 1))
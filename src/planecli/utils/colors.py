@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from rich.text import Text
 
 PRIORITY_COLORS: dict[str, str] = {
@@ -13,10 +15,12 @@ PRIORITY_COLORS: dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=256)
 def _normalize_hex(color: str) -> str:
     """Normalize a hex color string for Rich compatibility.
 
     Handles missing '#' prefix and 3-char shorthand (#fff -> #ffffff).
+    Cached: tables reuse the same handful of state/label/priority colors on every row.
     """
     color = color.strip()
     if not color.startswith("#"):
@@ -27,6 +31,7 @@ def _normalize_hex(color: str) -> str:
     return color
 
 
+@lru_cache(maxsize=256)
 def lighten_hex(color: str, factor: float = 0.35) -> str:
     """Lighten a hex color by blending it towards white.
 
@@ -34,10 +39,7 @@ def lighten_hex(color: str, factor: float = 0.35) -> str:
         color: Hex color string (e.g. '#a3a3a3').
         factor: 0.0 = unchanged, 1.0 = white. Default 0.35.
     """
-    color = _normalize_hex(color)
-    r = int(color[1:3], 16)
-    g = int(color[3:5], 16)
-    b = int(color[5:7], 16)
+    r, g, b = bytes.fromhex(_normalize_hex(color)[1:7])
     r = int(r + (255 - r) * factor)
     g = int(g + (255 - g) * factor)
     b = int(b + (255 - b) * factor)
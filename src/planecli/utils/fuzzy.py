@@ -5,18 +5,30 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Callable, Sequence
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 MIN_MATCH_SCORE = 60
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FuzzyMatch:
     item: Any
     score: float
     matched_value: str
 
 
+def _prepare(
+    query: str, items: Sequence[Any], key: Callable[[Any], str]
+) -> tuple[str, list[str], list[str]]:
+    """Extract each item's value once and lowercase query and values up front.
+
+    Scoring the pre-lowered lists with ``processor=None`` keeps rapidfuzz from
+    calling back into Python for every choice.
+    """
+    values = [key(item) for item in items]
+    return query.lower(), values, [value.lower() for value in values]
+
+
 def find_best_match(
     query: str,
     items: Sequence[Any],
@@ -26,6 +38,9 @@ def find_best_match(
 ) -> FuzzyMatch | None:
     """Find the single best fuzzy match for a query.
 
+    A case-insensitive exact match wins outright, even over an earlier item whose
+    tokens merely sort to the same string.
+
     Args:
         query: The search string.
         items: Sequence of objects to search through.
@@ -38,14 +53,20 @@ def find_best_match(
     if not items:
         return None
 
-    best: FuzzyMatch | None = None
-    for item in items:
-        value = key(item)
-        score = fuzz.token_sort_ratio(query.lower(), value.lower())
-        if score >= threshold and (best is None or score > best.score):
-            best = FuzzyMatch(item=item, score=score, matched_value=value)
-
-    return best
+    q, values, choices = _prepare(query, items, key)
+    # Most lookups use the exact name: take it without scoring anything
+    if q in choices:
+        index = choices.index(q)
+        return FuzzyMatch(item=items[index], score=100.0, matched_value=values[index])
+
+    # Score every choice inside rapidfuzz; on ties the first item wins
+    result = process.extractOne(
+        q, choices, scorer=fuzz.token_sort_ratio, processor=None, score_cutoff=threshold
+    )
+    if result is None:
+        return None
+    _, score, index = result
+    return FuzzyMatch(item=items[index], score=score, matched_value=values[index])
 
 
 def find_matches(
@@ -71,12 +92,17 @@ def find_matches(
     if not items:
         return []
 
-    matches: list[FuzzyMatch] = []
-    for item in items:
-        value = key(item)
-        score = fuzz.token_sort_ratio(query.lower(), value.lower())
-        if score >= threshold:
-            matches.append(FuzzyMatch(item=item, score=score, matched_value=value))
-
-    matches.sort(key=lambda m: m.score, reverse=True)
-    return matches[:limit]
+    q, values, choices = _prepare(query, items, key)
+    # Top-k selection happens inside rapidfuzz; ties keep their original order
+    results = process.extract(
+        q,
+        choices,
+        scorer=fuzz.token_sort_ratio,
+        processor=None,
+        limit=limit,
+        score_cutoff=threshold,
+    )
+    return [
+        FuzzyMatch(item=items[index], score=score, matched_value=values[index])
+        for _, score, index in results
+    ]
@@ -0,0 +1,19 @@
+"""HTML helpers for rendering Plane rich-text fields as plain text."""
+
+from __future__ import annotations
+
+import re
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def strip_html(html: str) -> str:
+    """Remove HTML tags from a rich-text field and trim surrounding whitespace.
+
+    A single regex substitution runs inside the C regex engine, which is faster
+    than a character-by-character scanner in Python even for very long bodies.
+    Text without any "<" cannot contain a tag, so it skips the regex entirely.
+    """
+    if "<" not in html:
+        return html.strip()
+    return _HTML_TAG_RE.sub("", html).strip()
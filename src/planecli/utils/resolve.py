@@ -5,8 +5,9 @@ Tries resolution in order: UUID direct lookup -> identifier match -> fuzzy name
 
 from __future__ import annotations
 
+import asyncio
 import re
-from typing import Any
+from typing import Any, Awaitable, Callable, Iterator
 
 from loguru import logger
 from plane.client import PlaneClient
@@ -14,10 +15,11 @@ from plane.errors import HttpError
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from planecli.exceptions import ResourceNotFoundError
-from planecli.utils.fuzzy import find_best_match, find_matches
+from planecli.utils.fuzzy import FuzzyMatch, find_best_match, find_matches
 
+# Canonical 36-char UUID; use with fullmatch()
 UUID_PATTERN = re.compile(
-    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
 )
 
 # Matches identifiers like ABC-123
@@ -25,7 +27,8 @@ ISSUE_ID_PATTERN = re.compile(r"^([A-Z]{1,10})-(\d+)$", re.IGNORECASE)
 
 
 def _is_uuid(value: str) -> bool:
-    return bool(UUID_PATTERN.match(value))
+    # Length gate first: names and identifiers never reach the regex engine
+    return len(value) == 36 and UUID_PATTERN.fullmatch(value) is not None
 
 
 def _is_retryable(exc: BaseException) -> bool:
@@ -52,22 +55,55 @@ def _fetch_page(list_fn: Any, *args: Any, **kwargs: Any) -> Any:
     return list_fn(*args, **kwargs)
 
 
-def _paginate_all(list_fn, *args, query_params_cls: type[Any] | None = None, **kwargs) -> list[Any]:
-    """Fetch all pages from a paginated SDK method."""
+def _paginate_iter(
+    list_fn, *args, query_params_cls: type[Any] | None = None, **kwargs
+) -> Iterator[list[Any]]:
+    """Yield each page of results from a paginated SDK method, fetching lazily."""
     from plane.models.query_params import PaginatedQueryParams
 
     params_cls = query_params_cls or PaginatedQueryParams
-    all_results = []
     cursor = None
     while True:
         params = params_cls(per_page=100, cursor=cursor)
         response = _fetch_page(list_fn, *args, params=params, **kwargs)
-        all_results.extend(response.results)
         logger.debug("Fetched page with {} results (cursor: {})", len(response.results), cursor)
+        yield response.results
         if not response.next_page_results:
             break
         cursor = response.next_cursor
-    return all_results
+
+
+def _paginate_all(list_fn, *args, query_params_cls: type[Any] | None = None, **kwargs) -> list[Any]:
+    """Fetch all pages from a paginated SDK method."""
+    return [
+        item
+        for page in _paginate_iter(list_fn, *args, query_params_cls=query_params_cls, **kwargs)
+        for item in page
+    ]
+
+
+def _match_name_paged(
+    query: str,
+    list_fn,
+    *args,
+    key: Callable[[Any], str],
+    query_params_cls: type[Any] | None = None,
+    **kwargs,
+) -> FuzzyMatch | None:
+    """Fuzzy-match a name against a paginated listing, stopping at an exact name.
+
+    An exact (case-insensitive) name always wins in find_best_match, so the first
+    page holding one settles the result and later pages are never fetched.
+    """
+    q = query.lower()
+    seen: list[Any] = []
+    for page in _paginate_iter(list_fn, *args, query_params_cls=query_params_cls, **kwargs):
+        for item in page:
+            value = key(item)
+            if value.lower() == q:
+                return FuzzyMatch(item=item, score=100.0, matched_value=value)
+        seen.extend(page)
+    return find_best_match(query, seen, key=key)
 
 
 def resolve_project(query: str, client: PlaneClient, workspace: str) -> dict[str, Any]:
@@ -84,13 +120,15 @@ def resolve_project(query: str, client: PlaneClient, workspace: str) -> dict[str
             _reraise_if_retryable(e)
             raise ResourceNotFoundError("Project", query)
 
-    # Fetch all projects for matching
-    projects = _paginate_all(client.projects.list, workspace)
-
-    # Try exact identifier match (case-insensitive)
-    for p in projects:
-        if hasattr(p, "identifier") and p.identifier and p.identifier.upper() == query.upper():
-            return p.model_dump()
+    # Try exact identifier match (case-insensitive); identifiers are unique, so
+    # a hit ends pagination and later pages are never fetched
+    identifier = query.upper()
+    projects: list[Any] = []
+    for page in _paginate_iter(client.projects.list, workspace):
+        for p in page:
+            if p.identifier and p.identifier.upper() == identifier:
+                return p.model_dump()
+        projects.extend(page)
 
     # Fuzzy name match
     match = find_best_match(query, projects, key=lambda p: p.name or "")
@@ -138,17 +176,17 @@ def resolve_work_item(
             _reraise_if_retryable(e)
             raise ResourceNotFoundError("Work item", query)
 
-    # Fuzzy name match - fetch all work items in project
+    # Fuzzy name match - page through the project's work items
     from plane.models.query_params import WorkItemQueryParams
 
-    items = _paginate_all(
+    match = _match_name_paged(
+        query,
         client.work_items.list,
         workspace,
         project_id,
+        key=lambda i: i.name or "",
         query_params_cls=WorkItemQueryParams,
     )
-
-    match = find_best_match(query, items, key=lambda i: i.name or "")
     if match:
         return match.item.model_dump()
 
@@ -220,20 +258,16 @@ def resolve_user(query: str, client: PlaneClient, workspace: str) -> dict[str, A
         raise ResourceNotFoundError("User", query)
 
     # Try exact email match
+    email = query.lower()
     for m in members:
-        if hasattr(m, "email") and m.email and m.email.lower() == query.lower():
+        if m.email and m.email.lower() == email:
             return m.model_dump()
 
     # Fuzzy match on display_name or first_name + last_name
     def user_name(u: Any) -> str:
-        if hasattr(u, "display_name") and u.display_name:
+        if u.display_name:
             return u.display_name
-        parts = []
-        if hasattr(u, "first_name") and u.first_name:
-            parts.append(u.first_name)
-        if hasattr(u, "last_name") and u.last_name:
-            parts.append(u.last_name)
-        return " ".join(parts) if parts else ""
+        return " ".join(part for part in (u.first_name, u.last_name) if part)
 
     match = find_best_match(query, members, key=user_name)
     if match:
@@ -242,52 +276,62 @@ def resolve_user(query: str, client: PlaneClient, workspace: str) -> dict[str, A
     raise ResourceNotFoundError("User", query)
 
 
-def resolve_module(
-    query: str, client: PlaneClient, workspace: str, project_id: str
+def _resolve_by_name(
+    kind: str,
+    retrieve_fn: Callable[..., Any],
+    list_fn: Callable[..., Any],
+    query: str,
+    workspace: str,
+    project_id: str,
 ) -> dict[str, Any]:
-    """Resolve a module by UUID or fuzzy name match.
-
-    Returns the module as a dict.
+    """Resolve a project-scoped resource by UUID or fuzzy name match.
+
+    Args:
+        kind: Resource name used in not-found errors (e.g. "Module").
+        retrieve_fn: SDK retrieve method, called as (workspace, project_id, id).
+        list_fn: Paginated SDK list method, called as (workspace, project_id).
+        query: UUID or name to resolve.
+        workspace: Workspace slug.
+        project_id: Project UUID.
     """
     if _is_uuid(query):
         try:
-            module = client.modules.retrieve(workspace, project_id, query)
-            return module.model_dump()
+            return retrieve_fn(workspace, project_id, query).model_dump()
         except HttpError as e:
             _reraise_if_retryable(e)
-            raise ResourceNotFoundError("Module", query)
+            raise ResourceNotFoundError(kind, query)
 
-    modules = _paginate_all(client.modules.list, workspace, project_id)
+    items = _paginate_all(list_fn, workspace, project_id)
 
-    match = find_best_match(query, modules, key=lambda m: m.name or "")
+    match = find_best_match(query, items, key=lambda x: x.name or "")
     if match:
         return match.item.model_dump()
 
-    raise ResourceNotFoundError("Module", query)
+    raise ResourceNotFoundError(kind, query)
 
 
-def resolve_state(
+def resolve_module(
     query: str, client: PlaneClient, workspace: str, project_id: str
 ) -> dict[str, Any]:
-    """Resolve a state by UUID or fuzzy name match.
+    """Resolve a module by UUID or fuzzy name match.
 
-    Returns the state as a dict.
+    Returns the module as a dict.
     """
-    if _is_uuid(query):
-        try:
-            state = client.states.retrieve(workspace, project_id, query)
-            return state.model_dump()
-        except HttpError as e:
-            _reraise_if_retryable(e)
-            raise ResourceNotFoundError("State", query)
+    return _resolve_by_name(
+        "Module", client.modules.retrieve, client.modules.list, query, workspace, project_id
+    )
 
-    states = _paginate_all(client.states.list, workspace, project_id)
 
-    match = find_best_match(query, states, key=lambda s: s.name or "")
-    if match:
-        return match.item.model_dump()
+def resolve_state(
+    query: str, client: PlaneClient, workspace: str, project_id: str
+) -> dict[str, Any]:
+    """Resolve a state by UUID or fuzzy name match.
 
-    raise ResourceNotFoundError("State", query)
+    Returns the state as a dict.
+    """
+    return _resolve_by_name(
+        "State", client.states.retrieve, client.states.list, query, workspace, project_id
+    )
 
 
 def resolve_cycle(
@@ -297,21 +341,9 @@ def resolve_cycle(
 
     Returns the cycle as a dict.
     """
-    if _is_uuid(query):
-        try:
-            cycle = client.cycles.retrieve(workspace, project_id, query)
-            return cycle.model_dump()
-        except HttpError as e:
-            _reraise_if_retryable(e)
-            raise ResourceNotFoundError("Cycle", query)
-
-    cycles = _paginate_all(client.cycles.list, workspace, project_id)
-
-    match = find_best_match(query, cycles, key=lambda c: c.name or "")
-    if match:
-        return match.item.model_dump()
-
-    raise ResourceNotFoundError("Cycle", query)
+    return _resolve_by_name(
+        "Cycle", client.cycles.retrieve, client.cycles.list, query, workspace, project_id
+    )
 
 
 def resolve_label(
@@ -321,21 +353,9 @@ def resolve_label(
 
     Returns the label as a dict.
     """
-    if _is_uuid(name):
-        try:
-            label = client.labels.retrieve(workspace, project_id, name)
-            return label.model_dump()
-        except HttpError as e:
-            _reraise_if_retryable(e)
-            raise ResourceNotFoundError("Label", name)
-
-    labels = _paginate_all(client.labels.list, workspace, project_id)
-
-    match = find_best_match(name, labels, key=lambda lbl: lbl.name or "")
-    if match:
-        return match.item.model_dump()
-
-    raise ResourceNotFoundError("Label", name)
+    return _resolve_by_name(
+        "Label", client.labels.retrieve, client.labels.list, name, workspace, project_id
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -360,8 +380,9 @@ async def resolve_project_async(
 
     projects = await cached_list_projects(workspace)
 
+    identifier = query.upper()
     for p in projects:
-        if p.get("identifier", "").upper() == query.upper():
+        if (p.get("identifier") or "").upper() == identifier:
             return p
 
     match = find_best_match(query, projects, key=lambda p: p.get("name", ""))
@@ -381,7 +402,7 @@ async def resolve_work_item_async(
     """Async version of resolve_work_item."""
     from plane.models.query_params import WorkItemQueryParams
 
-    from planecli.api.async_sdk import paginate_all_async, run_sdk
+    from planecli.api.async_sdk import run_sdk
 
     # NOTE: Use raw _get() to bypass WorkItemDetail Pydantic validation which
     # fails because the API returns assignees/labels as UUID strings, not objects.
@@ -408,14 +429,16 @@ async def resolve_work_item_async(
             _reraise_if_retryable(e)
             raise ResourceNotFoundError("Work item", query)
 
-    items = await paginate_all_async(
+    # Whole paged search runs in one worker thread, like paginate_all_async
+    match = await run_sdk(
+        _match_name_paged,
+        query,
         client.work_items.list,
         workspace,
         project_id,
+        key=lambda i: i.name or "",
         query_params_cls=WorkItemQueryParams,
     )
-
-    match = find_best_match(query, items, key=lambda i: i.name or "")
     if match:
         return match.item.model_dump()
 
@@ -426,8 +449,6 @@ async def resolve_work_item_across_projects_async(
     query: str, client: PlaneClient, workspace: str
 ) -> tuple[dict[str, Any], str]:
     """Async version of resolve_work_item_across_projects."""
-    import asyncio
-
     from planecli.api.async_sdk import run_sdk
     from planecli.cache import cached_list_projects
 
@@ -461,10 +482,17 @@ async def resolve_work_item_across_projects_async(
                 _reraise_if_retryable(e)
                 return None
 
-        results = await asyncio.gather(*[_try_project(p) for p in projects])
-        for result in results:
-            if result is not None:
-                return result
+        # Return on the first hit; cancelling the rest drops probes still
+        # queued on the API semaphore so they never reach the server.
+        tasks = [asyncio.create_task(_try_project(p)) for p in projects]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result is not None:
+                    return result
+        finally:
+            for task in tasks:
+                task.cancel()
         raise ResourceNotFoundError("Work item", query)
 
     raise ResourceNotFoundError(
@@ -490,19 +518,15 @@ async def resolve_user_async(
                 return m
         raise ResourceNotFoundError("User", query)
 
+    email = query.lower()
     for m in members:
-        if m.get("email", "").lower() == query.lower():
+        if (m.get("email") or "").lower() == email:
             return m
 
     def user_name(u: dict) -> str:
         if u.get("display_name"):
             return u["display_name"]
-        parts = []
-        if u.get("first_name"):
-            parts.append(u["first_name"])
-        if u.get("last_name"):
-            parts.append(u["last_name"])
-        return " ".join(parts) if parts else ""
+        return " ".join(part for part in (u.get("first_name"), u.get("last_name")) if part)
 
     match = find_best_match(query, members, key=user_name)
     if match:
@@ -511,76 +535,74 @@ async def resolve_user_async(
     raise ResourceNotFoundError("User", query)
 
 
-async def resolve_module_async(
-    query: str, client: PlaneClient, workspace: str, project_id: str
+async def _resolve_by_name_async(
+    kind: str,
+    retrieve_fn: Callable[..., Any],
+    cached_list_fn: Callable[[str, str], Awaitable[list[dict[str, Any]]]],
+    query: str,
+    workspace: str,
+    project_id: str,
 ) -> dict[str, Any]:
-    """Async version of resolve_module."""
+    """Async version of _resolve_by_name, matching names against a cached list.
+
+    Args:
+        kind: Resource name used in not-found errors (e.g. "Module").
+        retrieve_fn: SDK retrieve method, called as (workspace, project_id, id).
+        cached_list_fn: planecli.cache list function, called as (workspace, project_id).
+        query: UUID or name to resolve.
+        workspace: Workspace slug.
+        project_id: Project UUID.
+    """
     from planecli.api.async_sdk import run_sdk
-    from planecli.cache import cached_list_modules
 
     if _is_uuid(query):
         try:
-            module = await run_sdk(client.modules.retrieve, workspace, project_id, query)
-            return module.model_dump()
+            item = await run_sdk(retrieve_fn, workspace, project_id, query)
+            return item.model_dump()
         except HttpError as e:
             _reraise_if_retryable(e)
-            raise ResourceNotFoundError("Module", query)
+            raise ResourceNotFoundError(kind, query)
 
-    modules = await cached_list_modules(workspace, project_id)
+    items = await cached_list_fn(workspace, project_id)
 
-    match = find_best_match(query, modules, key=lambda m: m.get("name", ""))
+    match = find_best_match(query, items, key=lambda x: x.get("name", ""))
     if match:
         return match.item
 
-    raise ResourceNotFoundError("Module", query)
+    raise ResourceNotFoundError(kind, query)
 
 
-async def resolve_state_async(
+async def resolve_module_async(
     query: str, client: PlaneClient, workspace: str, project_id: str
 ) -> dict[str, Any]:
-    """Async version of resolve_state."""
-    from planecli.api.async_sdk import run_sdk
-    from planecli.cache import cached_list_states
+    """Async version of resolve_module."""
+    from planecli.cache import cached_list_modules
 
-    if _is_uuid(query):
-        try:
-            state = await run_sdk(client.states.retrieve, workspace, project_id, query)
-            return state.model_dump()
-        except HttpError as e:
-            _reraise_if_retryable(e)
-            raise ResourceNotFoundError("State", query)
+    return await _resolve_by_name_async(
+        "Module", client.modules.retrieve, cached_list_modules, query, workspace, project_id
+    )
 
-    states = await cached_list_states(workspace, project_id)
 
-    match = find_best_match(query, states, key=lambda s: s.get("name", ""))
-    if match:
-        return match.item
+async def resolve_state_async(
+    query: str, client: PlaneClient, workspace: str, project_id: str
+) -> dict[str, Any]:
+    """Async version of resolve_state."""
+    from planecli.cache import cached_list_states
 
-    raise ResourceNotFoundError("State", query)
+    return await _resolve_by_name_async(
+        "State", client.states.retrieve, cached_list_states, query, workspace, project_id
+    )
 
 
 async def resolve_cycle_async(
     query: str, client: PlaneClient, workspace: str, project_id: str
 ) -> dict[str, Any]:
     """Async version of resolve_cycle."""
-    from planecli.api.async_sdk import run_sdk
     from planecli.cache import cached_list_cycles
 
-    if _is_uuid(query):
-        try:
-            cycle = await run_sdk(client.cycles.retrieve, workspace, project_id, query)
-            return cycle.model_dump()
-        except HttpError as e:
-            _reraise_if_retryable(e)
-            raise ResourceNotFoundError("Cycle", query)
-
-    cycles = await cached_list_cycles(workspace, project_id)
-
-    match = find_best_match(query, cycles, key=lambda c: c.get("name", ""))
-    if match:
-        return match.item
-
-    raise ResourceNotFoundError("Cycle", query)
+    return await _resolve_by_name_async(
+        "Cycle", client.cycles.retrieve, cached_list_cycles, query, workspace, project_id
+    )
 
 
 async def resolve_estimate_point_async(
@@ -615,21 +637,34 @@ async def resolve_label_async(
     name: str, client: PlaneClient, workspace: str, project_id: str
 ) -> dict[str, Any]:
     """Async version of resolve_label."""
-    from planecli.api.async_sdk import run_sdk
     from planecli.cache import cached_list_labels
 
-    if _is_uuid(name):
-        try:
-            label = await run_sdk(client.labels.retrieve, workspace, project_id, name)
-            return label.model_dump()
-        except HttpError as e:
-            _reraise_if_retryable(e)
-            raise ResourceNotFoundError("Label", name)
+    return await _resolve_by_name_async(
+        "Label", client.labels.retrieve, cached_list_labels, name, workspace, project_id
+    )
 
-    labels = await cached_list_labels(workspace, project_id)
 
-    match = find_best_match(name, labels, key=lambda lbl: lbl.get("name", ""))
-    if match:
-        return match.item
+async def resolve_labels_async(
+    names: list[str], client: PlaneClient, workspace: str, project_id: str
+) -> list[dict[str, Any]]:
+    """Resolve several labels, fetching the project's label list at most once.
+
+    Names are fuzzy-matched against one cached_list_labels() call instead of one
+    per label (which all miss together on a cold cache). UUIDs are still retrieved
+    individually. Results keep the order of ``names``.
+    """
+    from planecli.cache import cached_list_labels
+
+    labels: list[dict[str, Any]] = []
+    if not all(_is_uuid(name) for name in names):
+        labels = await cached_list_labels(workspace, project_id)
+
+    async def _resolve_one(name: str) -> dict[str, Any]:
+        if _is_uuid(name):
+            return await resolve_label_async(name, client, workspace, project_id)
+        match = find_best_match(name, labels, key=lambda lbl: lbl.get("name", ""))
+        if match:
+            return match.item
+        raise ResourceNotFoundError("Label", name)
 
-    raise ResourceNotFoundError("Label", name)
+    return list(await asyncio.gather(*(_resolve_one(name) for name in names)))
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
 
+def make_page(results: list, next_cursor: str | None = None) -> SimpleNamespace:
+    """Stand in for a PaginatedResponse: _paginate_iter reads only these three fields."""
+    return SimpleNamespace(
+        results=results, next_page_results=next_cursor is not None, next_cursor=next_cursor
+    )
+
+
 @pytest.fixture(autouse=True)
 async def _setup_test_cache():
     """Configure cashews with mem:// backend for all tests (no disk I/O)."""
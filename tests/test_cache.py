@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
 
 from planecli.cache import (
     _cache_key,
@@ -26,13 +29,16 @@ from planecli.cache import (
 # --- Helpers ---
 
 
-def _make_model(data: dict) -> MagicMock:
-    """Create a mock Pydantic model with model_dump()."""
-    m = MagicMock()
-    m.model_dump.return_value = data
-    for k, v in data.items():
-        setattr(m, k, v)
-    return m
+def _make_model(data: dict) -> SimpleNamespace:
+    """Create a stand-in Pydantic model: fields as attributes plus model_dump()."""
+    return SimpleNamespace(**data, model_dump=lambda: data)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_url_hash():
+    """Pin the instance hash so cache keys are predictable ("abc123:...")."""
+    with patch("planecli.cache._url_hash", return_value="abc123"):
+        yield
 
 
 # --- Tests for get_cache_dir ---
@@ -61,14 +67,12 @@ def test_get_cache_dir_linux_xdg():
 # --- Tests for _cache_key ---
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-def test_cache_key_without_project(mock_hash):
+def test_cache_key_without_project():
     key = _cache_key("projects", "my-workspace")
     assert key == "abc123:projects:my-workspace"
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-def test_cache_key_with_project(mock_hash):
+def test_cache_key_with_project():
     key = _cache_key("states", "my-workspace", "proj-uuid")
     assert key == "abc123:states:my-workspace:proj-uuid"
 
@@ -76,8 +80,7 @@ def test_cache_key_with_project(mock_hash):
 # --- Tests for _cached_list ---
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-async def test_cached_list_miss_then_hit(mock_hash):
+async def test_cached_list_miss_then_hit():
     """First call fetches from API (miss), second returns from cache (hit)."""
     model = _make_model({"id": "1", "name": "Test Project"})
     fetch_fn = AsyncMock(return_value=[model])
@@ -93,8 +96,7 @@ async def test_cached_list_miss_then_hit(mock_hash):
     assert fetch_fn.call_count == 1
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-async def test_cached_list_no_cache_flag(mock_hash):
+async def test_cached_list_no_cache_flag():
     """--no-cache skips reads but still writes."""
     model = _make_model({"id": "1", "name": "Fresh"})
     fetch_fn = AsyncMock(return_value=[model])
@@ -116,8 +118,7 @@ async def test_cached_list_no_cache_flag(mock_hash):
     assert fetch_fn.call_count == 1
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-async def test_cached_list_handles_fetch_with_plain_dicts(mock_hash):
+async def test_cached_list_handles_fetch_with_plain_dicts():
     """Items without model_dump are stored as-is."""
     fetch_fn = AsyncMock(return_value=[{"id": "1", "name": "Dict Item"}])
 
@@ -130,118 +131,63 @@ async def test_cached_list_handles_fetch_with_plain_dicts(mock_hash):
 # import create_client/paginate_all_async/run_sdk inside their function bodies.
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-@patch("planecli.api.async_sdk.create_client")
-@patch("planecli.api.async_sdk.paginate_all_async")
-async def test_cached_list_projects(mock_paginate, mock_create_client, mock_hash):
-    project = _make_model({"id": "p1", "name": "My Project", "identifier": "MP"})
-    mock_paginate.return_value = [project]
-
-    result = await cached_list_projects("my-ws")
-    assert len(result) == 1
-    assert result[0]["name"] == "My Project"
-
-    # Second call should hit cache
-    result2 = await cached_list_projects("my-ws")
-    assert result2 == result
-    assert mock_paginate.call_count == 1  # only called once
-
-
-@patch("planecli.cache._url_hash", return_value="abc123")
-@patch("planecli.api.async_sdk.create_client")
-@patch("planecli.api.async_sdk.run_sdk", new_callable=AsyncMock)
-async def test_cached_list_members(mock_run_sdk, mock_create_client, mock_hash):
-    member = _make_model({
-        "id": "u1",
-        "display_name": "Alice",
-        "first_name": "Alice",
-        "last_name": "Smith",
-        "email": "alice@example.com",
-    })
-    mock_run_sdk.return_value = [member]
-
-    result = await cached_list_members("my-ws")
-    assert len(result) == 1
-    assert result[0]["display_name"] == "Alice"
-
-    # Second call should hit cache
-    result2 = await cached_list_members("my-ws")
-    assert result2 == result
-    assert mock_run_sdk.call_count == 1
-
-
-@patch("planecli.cache._url_hash", return_value="abc123")
-@patch("planecli.api.async_sdk.create_client")
-@patch("planecli.api.async_sdk.paginate_all_async")
-async def test_cached_list_states(mock_paginate, mock_create_client, mock_hash):
-    state = _make_model({"id": "s1", "name": "Todo", "color": "#000", "group": "unstarted"})
-    mock_paginate.return_value = [state]
-
-    result = await cached_list_states("my-ws", "proj-1")
-    assert result[0]["name"] == "Todo"
-
-    result2 = await cached_list_states("my-ws", "proj-1")
-    assert result2 == result
-    assert mock_paginate.call_count == 1
-
-
-@patch("planecli.cache._url_hash", return_value="abc123")
-@patch("planecli.api.async_sdk.create_client")
-@patch("planecli.api.async_sdk.paginate_all_async")
-async def test_cached_list_labels(mock_paginate, mock_create_client, mock_hash):
-    label = _make_model({"id": "l1", "name": "Bug", "color": "#f00"})
-    mock_paginate.return_value = [label]
-
-    result = await cached_list_labels("my-ws", "proj-1")
-    assert result[0]["name"] == "Bug"
-    assert mock_paginate.call_count == 1
-
-
-@patch("planecli.cache._url_hash", return_value="abc123")
-@patch("planecli.api.async_sdk.create_client")
-@patch("planecli.api.async_sdk.paginate_all_async")
-async def test_cached_list_modules(mock_paginate, mock_create_client, mock_hash):
-    module = _make_model({"id": "m1", "name": "Sprint 1"})
-    mock_paginate.return_value = [module]
-
-    result = await cached_list_modules("my-ws", "proj-1")
-    assert result[0]["name"] == "Sprint 1"
-    assert mock_paginate.call_count == 1
-
-
-@patch("planecli.cache._url_hash", return_value="abc123")
-@patch("planecli.api.async_sdk.create_client")
-@patch("planecli.api.async_sdk.paginate_all_async")
-async def test_cached_list_cycles(mock_paginate, mock_create_client, mock_hash):
-    cycle = _make_model({"id": "c1", "name": "Cycle 1"})
-    mock_paginate.return_value = [cycle]
-
-    result = await cached_list_cycles("my-ws", "proj-1")
-    assert result[0]["name"] == "Cycle 1"
-    assert mock_paginate.call_count == 1
-
-
-@patch("planecli.cache._url_hash", return_value="abc123")
-@patch("planecli.api.async_sdk.create_client")
-@patch("planecli.api.async_sdk.paginate_all_async")
-async def test_cached_list_work_items(mock_paginate, mock_create_client, mock_hash):
-    item = _make_model({"id": "wi1", "name": "Fix bug", "sequence_id": 1})
-    mock_paginate.return_value = [item]
+@pytest.mark.parametrize(
+    ("fn", "args", "sdk_call", "sample"),
+    [
+        (
+            cached_list_projects,
+            ("my-ws",),
+            "paginate_all_async",
+            {"id": "p1", "name": "My Project", "identifier": "MP"},
+        ),
+        (
+            cached_list_members,
+            ("my-ws",),
+            "run_sdk",
+            {"id": "u1", "display_name": "Alice", "email": "alice@example.com"},
+        ),
+        (
+            cached_list_states,
+            ("my-ws", "proj-1"),
+            "paginate_all_async",
+            {"id": "s1", "name": "Todo", "color": "#000", "group": "unstarted"},
+        ),
+        (
+            cached_list_labels,
+            ("my-ws", "proj-1"),
+            "paginate_all_async",
+            {"id": "l1", "name": "Bug", "color": "#f00"},
+        ),
+        (cached_list_modules, ("my-ws", "proj-1"), "paginate_all_async", {"id": "m1"}),
+        (cached_list_cycles, ("my-ws", "proj-1"), "paginate_all_async", {"id": "c1"}),
+        (
+            cached_list_work_items,
+            ("my-ws", "proj-1"),
+            "paginate_all_async",
+            {"id": "wi1", "name": "Fix bug", "sequence_id": 1},
+        ),
+    ],
+    ids=["projects", "members", "states", "labels", "modules", "cycles", "work_items"],
+)
+async def test_cached_list_fetches_once(fn, args, sdk_call, sample):
+    """Each cached_list_* dumps models on a miss and serves the second call from cache."""
+    with (
+        patch("planecli.api.async_sdk.create_client"),
+        patch(f"planecli.api.async_sdk.{sdk_call}", new_callable=AsyncMock) as mock_fetch,
+    ):
+        mock_fetch.return_value = [_make_model(sample)]
 
-    result = await cached_list_work_items("my-ws", "proj-1")
-    assert len(result) == 1
-    assert result[0]["name"] == "Fix bug"
+        result = await fn(*args)
+        assert result == [sample]
 
-    # Second call should hit cache
-    result2 = await cached_list_work_items("my-ws", "proj-1")
-    assert result2 == result
-    assert mock_paginate.call_count == 1  # only called once
+        # Second call should hit cache
+        assert await fn(*args) == result
+        assert mock_fetch.call_count == 1
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
 @patch("planecli.api.async_sdk.create_client")
 @patch("planecli.api.async_sdk.run_sdk", new_callable=AsyncMock)
-async def test_cached_get_me(mock_run_sdk, mock_create_client, mock_hash):
+async def test_cached_get_me(mock_run_sdk, mock_create_client):
     me = _make_model({
         "id": "user-1",
         "display_name": "Patrick",
@@ -262,8 +208,7 @@ async def test_cached_get_me(mock_run_sdk, mock_create_client, mock_hash):
 # --- Tests for invalidation ---
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-async def test_invalidate_resource(mock_hash):
+async def test_invalidate_resource():
     """invalidate_resource removes the specific cache entry."""
     await cache.set("abc123:states:ws:p1", [{"id": "s1"}], expire="10m")
 
@@ -292,9 +237,8 @@ async def test_invalidate_all():
 # --- Tests for cache error recovery ---
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
 @patch("planecli.cache.logger")
-async def test_cache_read_error_falls_back_to_api(mock_logger, mock_hash):
+async def test_cache_read_error_falls_back_to_api(mock_logger):
     """If cache.get raises, fall back to API fetch."""
     model = _make_model({"id": "1", "name": "Fallback"})
     fetch_fn = AsyncMock(return_value=[model])
@@ -308,9 +252,8 @@ async def test_cache_read_error_falls_back_to_api(mock_logger, mock_hash):
     assert "Cache read error" in str(mock_logger.warning.call_args)
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
 @patch("planecli.cache.logger")
-async def test_cache_write_error_still_returns_data(mock_logger, mock_hash):
+async def test_cache_write_error_still_returns_data(mock_logger):
     """If cache.set raises, data is still returned from API."""
     model = _make_model({"id": "1", "name": "WriteError"})
     fetch_fn = AsyncMock(return_value=[model])
@@ -326,23 +269,20 @@ async def test_cache_write_error_still_returns_data(mock_logger, mock_hash):
 # --- Tests for per-item comment caching (cached_list_comments) ---
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-def test_cache_key_with_item(mock_hash):
+def test_cache_key_with_item():
     key = _cache_key("comments", "my-workspace", "proj-uuid", "item-uuid")
     assert key == "abc123:comments:my-workspace:proj-uuid:item-uuid"
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-def test_cache_key_item_ignored_without_project(mock_hash):
+def test_cache_key_item_ignored_without_project():
     # item_id only scopes when a project_id is also present
     key = _cache_key("comments", "my-workspace", None, "item-uuid")
     assert key == "abc123:comments:my-workspace"
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
 @patch("planecli.api.async_sdk.create_client")
 @patch("planecli.api.async_sdk.paginate_all_async")
-async def test_cached_list_comments(mock_paginate, mock_create_client, mock_hash):
+async def test_cached_list_comments(mock_paginate, mock_create_client):
     comment = _make_model({"id": "c1", "comment_html": "<p>hi</p>", "actor": "u1"})
     mock_paginate.return_value = [comment]
 
@@ -358,10 +298,9 @@ async def test_cached_list_comments(mock_paginate, mock_create_client, mock_hash
     assert mock_paginate.call_count == 1
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
 @patch("planecli.api.async_sdk.create_client")
 @patch("planecli.api.async_sdk.paginate_all_async")
-async def test_cached_list_comments_keys_per_item(mock_paginate, mock_create_client, mock_hash):
+async def test_cached_list_comments_keys_per_item(mock_paginate, mock_create_client):
     """Two work items cache independently (no cross-item collision)."""
     mock_paginate.side_effect = [
         [_make_model({"id": "c1"})],
@@ -379,8 +318,7 @@ async def test_cached_list_comments_keys_per_item(mock_paginate, mock_create_cli
     assert mock_paginate.call_count == 2
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-async def test_invalidate_resource_with_item(mock_hash):
+async def test_invalidate_resource_with_item():
     await cache.set("abc123:comments:ws:p1:item-1", [{"id": "c1"}], expire="1m")
     assert await cache.get("abc123:comments:ws:p1:item-1") is not None
 
@@ -392,8 +330,7 @@ async def test_invalidate_resource_with_item(mock_hash):
 # --- Tests for different workspaces/projects isolation ---
 
 
-@patch("planecli.cache._url_hash", return_value="abc123")
-async def test_different_projects_have_separate_cache(mock_hash):
+async def test_different_projects_have_separate_cache():
     """States for different projects are cached independently."""
     await cache.set("abc123:states:ws:proj-A", [{"id": "sA"}], expire="10m")
     await cache.set("abc123:states:ws:proj-B", [{"id": "sB"}], expire="10m")
@@ -0,0 +1,22 @@
+"""Tests for color utilities."""
+
+from __future__ import annotations
+
+import pytest
+
+from planecli.utils.colors import lighten_hex
+
+
+class TestLightenHex:
+    def test_blends_towards_white(self):
+        assert lighten_hex("#a3a3a3") == "#c3c3c3"
+
+    def test_custom_factor(self):
+        assert lighten_hex("#000000", 0.5) == "#7f7f7f"
+
+    def test_accepts_shorthand_without_hash(self):
+        assert lighten_hex("fff") == "#ffffff"
+
+    def test_invalid_hex_raises(self):
+        with pytest.raises(ValueError):
+            lighten_hex("#zzzzzz")
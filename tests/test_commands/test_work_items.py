@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from plane.errors import HttpError
 
 from planecli.commands.work_items import WI_COLUMNS, WI_FIELDS, create, list_, update
 from planecli.commands.work_items import _enrich_work_item
+from planecli.exceptions import AuthenticationError, ResourceNotFoundError
 
 
 def _make_http_error(status_code: int, message: str = "") -> HttpError:
@@ -16,6 +19,11 @@ def _make_http_error(status_code: int, message: str = "") -> HttpError:
     return HttpError(message or f"HTTP {status_code}", status_code=status_code)
 
 
+def _make_sdk_model(data: dict) -> SimpleNamespace:
+    """Stand in for an SDK model returned by run_sdk: only model_dump() is used."""
+    return SimpleNamespace(model_dump=lambda: data)
+
+
 def _make_member_dict(member_id: str, first_name: str, last_name: str, display_name: str):
     """Return a member as a dict (how cached_list_members returns them)."""
     return {
@@ -71,117 +79,95 @@ def _make_project_dict(project_id: str, identifier: str, name: str):
 class TestWiList:
     """Tests for the wi list command."""
 
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.commands.work_items.resolve_project_async")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_single_project(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_resolve_project,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
+    @pytest.fixture(autouse=True)
+    def _patch_list_deps(self):
+        """Patch the collaborators every wi list test needs, exposed as ``self.mocks``.
+
+        Cached lists default to empty; tests only set the ones they care about.
+        """
+        with ExitStack() as stack:
+
+            def _patch(target: str, **kwargs):
+                return stack.enter_context(patch(target, **kwargs))
+
+            def _cached(resource: str):
+                target = f"planecli.cache.cached_list_{resource}"
+                return _patch(target, new_callable=AsyncMock, return_value=[])
+
+            self.mocks = SimpleNamespace(
+                output=_patch("planecli.commands.work_items.output"),
+                get_ws=_patch("planecli.commands.work_items.get_workspace", return_value="test-ws"),
+                get_client=_patch("planecli.commands.work_items.get_client"),
+                cached_work_items=_cached("work_items"),
+                cached_members=_cached("members"),
+                cached_projects=_cached("projects"),
+                cached_states=_cached("states"),
+                cached_labels=_cached("labels"),
+                resolve_project=_patch("planecli.commands.work_items.resolve_project_async"),
+                resolve_user=_patch("planecli.commands.work_items.resolve_user_async"),
+                resolve_parent=_patch(
+                    "planecli.commands.work_items.resolve_work_item_across_projects_async"
+                ),
+            )
+            yield
+
+    async def test_list_single_project(self):
         """wi list -p Frontend should list items from one project only."""
-        client = MagicMock()
-        mock_get_client.return_value = client
-
-        proj_client = MagicMock()
-        mock_create_client.return_value = proj_client
-
         # Members (cached)
-        mock_cached_members.return_value = [
+        self.mocks.cached_members.return_value = [
             _make_member_dict("user-1", "Patrick", "Alves", "Patrick"),
         ]
 
         # Project resolution
-        mock_resolve_project.return_value = _make_project_dict("proj-1", "FE", "Frontend")
+        self.mocks.resolve_project.return_value = _make_project_dict("proj-1", "FE", "Frontend")
 
         # Work items (cached)
-        mock_cached_work_items.return_value = [
+        self.mocks.cached_work_items.return_value = [
             _make_work_item_dict("wi-1", "Fix bug", 1),
             _make_work_item_dict("wi-2", "Add feature", 2),
         ]
 
         # States and labels (cached)
-        mock_cached_states.return_value = [_make_state_dict("state-uuid-1", "Todo")]
-        mock_cached_labels.return_value = []
+        self.mocks.cached_states.return_value = [_make_state_dict("state-uuid-1", "Todo")]
 
         await list_(project="Frontend")
 
-        mock_output.assert_called_once()
-        call_args = mock_output.call_args
+        self.mocks.output.assert_called_once()
+        call_args = self.mocks.output.call_args
         data = call_args[0][0]
         columns = call_args[0][1]
         assert len(data) == 2
         assert columns == WI_COLUMNS
 
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_all_projects_no_flag(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
+    async def test_list_all_projects_no_flag(self):
         """wi list without --project should list items from all projects."""
-        client = MagicMock()
-        mock_get_client.return_value = client
-
-        proj_client = MagicMock()
-        mock_create_client.return_value = proj_client
-
         # Members (cached)
-        mock_cached_members.return_value = [
+        self.mocks.cached_members.return_value = [
             _make_member_dict("user-1", "Patrick", "Alves", "Patrick"),
         ]
 
         # Projects (cached)
-        mock_cached_projects.return_value = [
+        self.mocks.cached_projects.return_value = [
             _make_project_dict("proj-1", "FE", "Frontend"),
             _make_project_dict("proj-2", "BE", "Backend"),
         ]
 
-        # Work items per project (cached)
-        mock_cached_work_items.side_effect = [
-            [_make_work_item_dict("wi-1", "Fix bug", 1)],
-            [_make_work_item_dict("wi-2", "Add API", 5)],
-        ]
-
-        # States and labels (cached, called per project)
-        mock_cached_states.side_effect = [
-            [_make_state_dict("state-uuid-1", "Todo")],
-            [_make_state_dict("state-uuid-1", "In Progress")],
-        ]
-        mock_cached_labels.side_effect = [[], []]
+        # Work items and states per project (cached), keyed by project id
+        items_by_project = {
+            "proj-1": [_make_work_item_dict("wi-1", "Fix bug", 1)],
+            "proj-2": [_make_work_item_dict("wi-2", "Add API", 5)],
+        }
+        states_by_project = {
+            "proj-1": [_make_state_dict("state-uuid-1", "Todo")],
+            "proj-2": [_make_state_dict("state-uuid-1", "In Progress")],
+        }
+        self.mocks.cached_work_items.side_effect = lambda ws, pid: items_by_project[pid]
+        self.mocks.cached_states.side_effect = lambda ws, pid: states_by_project[pid]
 
         await list_()
 
-        mock_output.assert_called_once()
-        call_args = mock_output.call_args
+        self.mocks.output.assert_called_once()
+        call_args = self.mocks.output.call_args
         data = call_args[0][0]
 
         # Items from both projects
@@ -189,154 +175,19 @@ class TestWiList:
         identifiers = {d["project_identifier"] for d in data}
         assert identifiers == {"FE", "BE"}
 
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_all_projects_empty_projects_skipped(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """Empty projects (no work items) should be silently skipped."""
-        client = MagicMock()
-        mock_get_client.return_value = client
-
-        proj_client = MagicMock()
-        mock_create_client.return_value = proj_client
-
-        mock_cached_members.return_value = []
-
-        mock_cached_projects.return_value = [
-            _make_project_dict("proj-1", "FE", "Frontend"),
-            _make_project_dict("proj-2", "EMPTY", "Empty Project"),
-        ]
-
-        mock_cached_work_items.side_effect = [
-            [_make_work_item_dict("wi-1", "Fix bug", 1)],  # FE items
-            [],  # EMPTY items
-        ]
-
-        mock_cached_states.side_effect = [
-            [],  # FE states
-            [],  # EMPTY states
-        ]
-        mock_cached_labels.side_effect = [
-            [],  # FE labels
-            [],  # EMPTY labels
-        ]
-
-        await list_()
-
-        call_args = mock_output.call_args
-        data = call_args[0][0]
-        assert len(data) == 1
-        assert data[0]["project_identifier"] == "FE"
-
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.resolve_user_async")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_all_projects_filter_by_assignee(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_resolve_user,
-        mock_output,
-    ):
-        """--assignee filter should work across all projects."""
-        client = MagicMock()
-        mock_get_client.return_value = client
-
-        proj_client = MagicMock()
-        mock_create_client.return_value = proj_client
-
-        mock_cached_members.return_value = [
-            _make_member_dict("user-1", "Patrick", "Alves", "Patrick"),
-        ]
-
-        mock_cached_projects.return_value = [
-            _make_project_dict("proj-1", "FE", "Frontend"),
-        ]
-
-        mock_cached_work_items.return_value = [
-            _make_work_item_dict("wi-1", "Assigned to me", 1, assignees=["user-1"]),
-            _make_work_item_dict("wi-2", "Unassigned", 2, assignees=[]),
-        ]
-
-        mock_cached_states.return_value = []
-        mock_cached_labels.return_value = []
-
-        mock_resolve_user.return_value = {"id": "user-1", "display_name": "Patrick"}
-
-        await list_(assignee="me")
-
-        call_args = mock_output.call_args
-        data = call_args[0][0]
-        assert len(data) == 1
-        assert data[0]["name"] == "Assigned to me"
-
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.resolve_user_async")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_filter_by_assignee_and_multiple_states(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_resolve_user,
-        mock_output,
-    ):
+    async def test_list_filter_by_assignee_and_multiple_states(self):
         """--assignee me --state 'In Review,In Progress' uses AND logic."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
 
-        mock_cached_members.return_value = [
+        self.mocks.cached_members.return_value = [
             _make_member_dict("user-1", "Patrick", "Alves", "Patrick"),
             _make_member_dict("user-2", "Braulio", "Silva", "Braulio"),
         ]
 
-        mock_cached_projects.return_value = [
+        self.mocks.cached_projects.return_value = [
             _make_project_dict("proj-1", "FE", "Frontend"),
         ]
 
-        mock_cached_work_items.return_value = [
+        self.mocks.cached_work_items.return_value = [
             _make_work_item_dict(
                 "wi-1", "My progress task", 1, state="s-progress", assignees=["user-1"],
             ),
@@ -351,652 +202,200 @@ class TestWiList:
             ),
         ]
 
-        mock_cached_states.return_value = [
+        self.mocks.cached_states.return_value = [
             _make_state_dict("s-progress", "In Progress"),
             _make_state_dict("s-review", "In Review"),
             _make_state_dict("s-done", "Done"),
         ]
-        mock_cached_labels.return_value = []
 
-        mock_resolve_user.return_value = {"id": "user-1", "display_name": "Patrick"}
+        self.mocks.resolve_user.return_value = {"id": "user-1", "display_name": "Patrick"}
 
         await list_(assignee="me", state="In Review,In Progress")
 
-        data = mock_output.call_args[0][0]
+        data = self.mocks.output.call_args[0][0]
         assert len(data) == 2
         names = {d["name"] for d in data}
         assert names == {"My progress task", "My review task"}
 
-    @patch("planecli.commands.work_items.resolve_user_async")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_filter_by_assignee_resolution_error(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_resolve_user,
-    ):
+    async def test_list_filter_by_assignee_resolution_error(self):
         """--assignee with invalid user raises error instead of silently passing."""
-        from planecli.exceptions import ResourceNotFoundError
-
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
-        mock_cached_projects.return_value = [
+        self.mocks.cached_projects.return_value = [
             _make_project_dict("proj-1", "FE", "Frontend"),
         ]
-        mock_cached_work_items.return_value = [
+        self.mocks.cached_work_items.return_value = [
             _make_work_item_dict("wi-1", "Some task", 1, assignees=["user-1"]),
         ]
-        mock_cached_states.return_value = []
-        mock_cached_labels.return_value = []
 
-        mock_resolve_user.side_effect = ResourceNotFoundError("User", "nonexistent")
+        self.mocks.resolve_user.side_effect = ResourceNotFoundError("User", "nonexistent")
 
-        import pytest
         with pytest.raises(ResourceNotFoundError):
             await list_(assignee="nonexistent")
 
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_all_projects_filter_by_state(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """--state filter should work across all projects."""
-        client = MagicMock()
-        mock_get_client.return_value = client
-
-        proj_client = MagicMock()
-        mock_create_client.return_value = proj_client
-
-        mock_cached_members.return_value = []
-
-        mock_cached_projects.return_value = [
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, [("BE", "BE new"), ("FE", "FE mid"), ("FE", "FE old")]),
+            ({"assignee": "me"}, [("FE", "FE old")]),
+            ({"state": "In Progress"}, [("BE", "BE new")]),
+            ({"limit": 2}, [("BE", "BE new"), ("FE", "FE mid")]),
+            ({"json": True}, [("BE", "BE new"), ("FE", "FE mid"), ("FE", "FE old")]),
+        ],
+        ids=[
+            "empty-projects-skipped",
+            "filter-by-assignee",
+            "filter-by-state",
+            "sort-and-limit",
+            "json-output",
+        ],
+    )
+    async def test_list_all_projects_scenarios(self, kwargs, expected):
+        """Filters, sort/limit and --json apply to the merged all-projects listing."""
+        items_by_project = {
+            "proj-1": [
+                _make_work_item_dict(
+                    "wi-1", "FE old", 1, state="s-todo", assignees=["user-1"],
+                    created_at="2026-02-01T12:00:00Z",
+                ),
+                _make_work_item_dict(
+                    "wi-3", "FE mid", 3, state="s-todo", created_at="2026-02-05T12:00:00Z",
+                ),
+            ],
+            "proj-2": [
+                _make_work_item_dict(
+                    "wi-2", "BE new", 2, state="s-progress", created_at="2026-02-10T12:00:00Z",
+                ),
+            ],
+            "proj-3": [],
+        }
+        self.mocks.cached_projects.return_value = [
             _make_project_dict("proj-1", "FE", "Frontend"),
             _make_project_dict("proj-2", "BE", "Backend"),
+            _make_project_dict("proj-3", "EMPTY", "Empty Project"),
         ]
-
-        mock_cached_work_items.side_effect = [
-            [_make_work_item_dict("wi-1", "FE task", 1, state="s-todo")],
-            [_make_work_item_dict("wi-2", "BE task", 2, state="s-progress")],
-        ]
-
-        mock_cached_states.side_effect = [
-            [_make_state_dict("s-todo", "Todo")],
-            [_make_state_dict("s-progress", "In Progress")],
-        ]
-        mock_cached_labels.side_effect = [[], []]
-
-        await list_(state="In Progress")
-
-        call_args = mock_output.call_args
-        data = call_args[0][0]
-        assert len(data) == 1
-        assert data[0]["project_identifier"] == "BE"
-
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_all_projects_sort_and_limit(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """--sort and --limit should work across merged results."""
-        client = MagicMock()
-        mock_get_client.return_value = client
-
-        proj_client = MagicMock()
-        mock_create_client.return_value = proj_client
-
-        mock_cached_members.return_value = []
-
-        mock_cached_projects.return_value = [
-            _make_project_dict("proj-1", "FE", "Frontend"),
-        ]
-
-        mock_cached_work_items.return_value = [
-            _make_work_item_dict("wi-1", "Old item", 1, created_at="2026-02-01T12:00:00Z"),
-            _make_work_item_dict("wi-2", "New item", 2, created_at="2026-02-10T12:00:00Z"),
-            _make_work_item_dict("wi-3", "Mid item", 3, created_at="2026-02-05T12:00:00Z"),
-        ]
-
-        mock_cached_states.return_value = []
-        mock_cached_labels.return_value = []
-
-        await list_(limit=2)
-
-        call_args = mock_output.call_args
-        data = call_args[0][0]
-        # Sorted by created desc, limited to 2
-        assert len(data) == 2
-        assert data[0]["name"] == "New item"
-        assert data[1]["name"] == "Mid item"
-
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_all_projects_json_output(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """--json flag should work with all-projects listing."""
-        client = MagicMock()
-        mock_get_client.return_value = client
-
-        proj_client = MagicMock()
-        mock_create_client.return_value = proj_client
-
-        mock_cached_members.return_value = []
-
-        mock_cached_projects.return_value = [
-            _make_project_dict("proj-1", "FE", "Frontend"),
-        ]
-
-        mock_cached_work_items.return_value = [
-            _make_work_item_dict("wi-1", "Fix bug", 1),
-        ]
-
-        mock_cached_states.return_value = []
-        mock_cached_labels.return_value = []
-
-        await list_(json=True)
-
-        call_args = mock_output.call_args
-        assert call_args[1]["as_json"] is True
-        data = call_args[0][0]
-        assert data[0]["project_identifier"] == "FE"
-
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_filter_by_single_state(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """Single --state value still works (backward compat)."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
-        mock_cached_projects.return_value = [
-            _make_project_dict("proj-1", "FE", "Frontend"),
-        ]
-        mock_cached_work_items.return_value = [
-            _make_work_item_dict("wi-1", "Todo task", 1, state="s-todo"),
-            _make_work_item_dict("wi-2", "Done task", 2, state="s-done"),
-        ]
-        mock_cached_states.return_value = [
+        self.mocks.cached_work_items.side_effect = lambda ws, pid: items_by_project[pid]
+        self.mocks.cached_states.return_value = [
             _make_state_dict("s-todo", "Todo"),
-            _make_state_dict("s-done", "Done"),
+            _make_state_dict("s-progress", "In Progress"),
         ]
-        mock_cached_labels.return_value = []
+        self.mocks.resolve_user.return_value = {"id": "user-1", "display_name": "Patrick"}
 
-        await list_(state="Todo")
+        await list_(**kwargs)
 
-        data = mock_output.call_args[0][0]
-        assert len(data) == 1
-        assert data[0]["name"] == "Todo task"
-
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_filter_by_multiple_states(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """--state 'Todo,In Progress' returns items matching either state."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
-        mock_cached_projects.return_value = [
+        call_args = self.mocks.output.call_args
+        assert call_args[1]["as_json"] is kwargs.get("json", False)
+        data = call_args[0][0]
+        assert [(d["project_identifier"], d["name"]) for d in data] == expected
+
+    @pytest.mark.parametrize(
+        ("filters", "expected"),
+        [
+            ({"state": "Todo"}, {"Todo bug", "Todo frontend"}),
+            ({"state": "Todo,In Progress"}, {"Todo bug", "Todo frontend", "Progress backend"}),
+            ({"state": " Todo , Done "}, {"Todo bug", "Todo frontend", "Done bug", "Done plain"}),
+            ({"labels": "bug"}, {"Todo bug", "Done bug"}),
+            ({"labels": "bug,frontend"}, {"Todo bug", "Todo frontend", "Done bug"}),
+            ({"labels": "nonexistent"}, set()),
+            ({"state": "Todo", "labels": "bug"}, {"Todo bug"}),
+        ],
+        ids=[
+            "single-state",
+            "multiple-states",
+            "state-whitespace",
+            "single-label",
+            "multiple-labels",
+            "label-no-match",
+            "state-and-label",
+        ],
+    )
+    async def test_list_filter_by_state_and_labels(self, filters, expected):
+        """--state/--labels take comma lists (OR within a flag) and AND across flags."""
+        self.mocks.cached_projects.return_value = [
             _make_project_dict("proj-1", "FE", "Frontend"),
         ]
-        mock_cached_work_items.return_value = [
-            _make_work_item_dict("wi-1", "Todo task", 1, state="s-todo"),
-            _make_work_item_dict("wi-2", "Progress task", 2, state="s-progress"),
-            _make_work_item_dict("wi-3", "Done task", 3, state="s-done"),
+        self.mocks.cached_work_items.return_value = [
+            _make_work_item_dict("wi-1", "Todo bug", 1, state="s-todo", labels=["lbl-bug"]),
+            _make_work_item_dict("wi-2", "Todo frontend", 2, state="s-todo", labels=["lbl-fe"]),
+            _make_work_item_dict(
+                "wi-3", "Progress backend", 3, state="s-progress", labels=["lbl-be"]
+            ),
+            _make_work_item_dict("wi-4", "Done bug", 4, state="s-done", labels=["lbl-bug"]),
+            _make_work_item_dict("wi-5", "Done plain", 5, state="s-done"),
         ]
-        mock_cached_states.return_value = [
+        self.mocks.cached_states.return_value = [
             _make_state_dict("s-todo", "Todo"),
             _make_state_dict("s-progress", "In Progress"),
             _make_state_dict("s-done", "Done"),
         ]
-        mock_cached_labels.return_value = []
+        self.mocks.cached_labels.return_value = [
+            _make_label_dict("lbl-bug", "bug"),
+            _make_label_dict("lbl-fe", "frontend"),
+            _make_label_dict("lbl-be", "backend"),
+        ]
 
-        await list_(state="Todo,In Progress")
+        await list_(**filters)
 
-        data = mock_output.call_args[0][0]
-        assert len(data) == 2
-        names = {d["name"] for d in data}
-        assert names == {"Todo task", "Progress task"}
+        data = self.mocks.output.call_args[0][0]
+        assert {d["name"] for d in data} == expected
 
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.resolve_work_item_across_projects_async")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_filter_by_parent(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_resolve_parent,
-        mock_output,
-    ):
+    async def test_list_filter_by_parent(self):
         """--parent ABC-1 returns only items whose parent matches the resolved UUID."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
-        mock_cached_projects.return_value = [
+        self.mocks.cached_projects.return_value = [
             _make_project_dict("proj-1", "FE", "Frontend"),
         ]
-        mock_cached_work_items.return_value = [
+        self.mocks.cached_work_items.return_value = [
             _make_work_item_dict("wi-1", "Child A", 1, parent="parent-uuid"),
             _make_work_item_dict("wi-2", "Child B", 2, parent="parent-uuid"),
             _make_work_item_dict("wi-3", "Unrelated", 3, parent="other-uuid"),
             _make_work_item_dict("wi-4", "Orphan", 4, parent=None),
         ]
-        mock_cached_states.return_value = []
-        mock_cached_labels.return_value = []
-        mock_resolve_parent.return_value = ({"id": "parent-uuid"}, "proj-1")
+        self.mocks.resolve_parent.return_value = ({"id": "parent-uuid"}, "proj-1")
 
         await list_(parent="FE-99")
 
-        mock_resolve_parent.assert_called_once()
-        data = mock_output.call_args[0][0]
+        self.mocks.resolve_parent.assert_called_once()
+        data = self.mocks.output.call_args[0][0]
         names = {d["name"] for d in data}
         assert names == {"Child A", "Child B"}
 
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_filter_by_single_label(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """--labels 'bug' returns items with 'bug' label."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
-        mock_cached_projects.return_value = [
+    async def test_list_filter_label_token_does_not_span_labels(self):
+        """A token only matches within a single label name, not across two."""
+        self.mocks.cached_projects.return_value = [
             _make_project_dict("proj-1", "FE", "Frontend"),
         ]
-        mock_cached_work_items.return_value = [
-            _make_work_item_dict("wi-1", "Bug task", 1, labels=["lbl-bug"]),
-            _make_work_item_dict("wi-2", "Feature task", 2, labels=["lbl-feat"]),
+        self.mocks.cached_work_items.return_value = [
+            _make_work_item_dict("wi-1", "Split labels", 1, labels=["lbl-bug", "lbl-fix"]),
+            _make_work_item_dict("wi-2", "Single label", 2, labels=["lbl-bugfix"]),
         ]
-        mock_cached_states.return_value = []
-        mock_cached_labels.return_value = [
+        self.mocks.cached_labels.return_value = [
             _make_label_dict("lbl-bug", "bug"),
-            _make_label_dict("lbl-feat", "feature"),
+            _make_label_dict("lbl-fix", "Fix"),
+            _make_label_dict("lbl-bugfix", "BugFix"),
         ]
 
-        await list_(labels="bug")
+        await list_(labels="bugfix")
 
-        data = mock_output.call_args[0][0]
-        assert len(data) == 1
-        assert data[0]["name"] == "Bug task"
+        data = self.mocks.output.call_args[0][0]
+        assert [d["name"] for d in data] == ["Single label"]
 
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_filter_by_multiple_labels(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """--labels 'bug,frontend' returns items matching either label."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
-        mock_cached_projects.return_value = [
-            _make_project_dict("proj-1", "FE", "Frontend"),
-        ]
-        mock_cached_work_items.return_value = [
-            _make_work_item_dict("wi-1", "Bug task", 1, labels=["lbl-bug"]),
-            _make_work_item_dict("wi-2", "FE task", 2, labels=["lbl-fe"]),
-            _make_work_item_dict("wi-3", "Backend task", 3, labels=["lbl-be"]),
-        ]
-        mock_cached_states.return_value = []
-        mock_cached_labels.return_value = [
-            _make_label_dict("lbl-bug", "bug"),
-            _make_label_dict("lbl-fe", "frontend"),
-            _make_label_dict("lbl-be", "backend"),
-        ]
-
-        await list_(labels="bug,frontend")
-
-        data = mock_output.call_args[0][0]
-        assert len(data) == 2
-        names = {d["name"] for d in data}
-        assert names == {"Bug task", "FE task"}
-
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_filter_state_and_labels_combined(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """--state 'Todo' --labels 'bug' uses AND logic."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
-        mock_cached_projects.return_value = [
-            _make_project_dict("proj-1", "FE", "Frontend"),
-        ]
-        mock_cached_work_items.return_value = [
-            _make_work_item_dict("wi-1", "Todo bug", 1, state="s-todo", labels=["lbl-bug"]),
-            _make_work_item_dict("wi-2", "Todo feat", 2, state="s-todo", labels=["lbl-feat"]),
-            _make_work_item_dict("wi-3", "Done bug", 3, state="s-done", labels=["lbl-bug"]),
-        ]
-        mock_cached_states.return_value = [
-            _make_state_dict("s-todo", "Todo"),
-            _make_state_dict("s-done", "Done"),
-        ]
-        mock_cached_labels.return_value = [
-            _make_label_dict("lbl-bug", "bug"),
-            _make_label_dict("lbl-feat", "feature"),
-        ]
-
-        await list_(state="Todo", labels="bug")
-
-        data = mock_output.call_args[0][0]
-        assert len(data) == 1
-        assert data[0]["name"] == "Todo bug"
-
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_filter_state_with_whitespace(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """Whitespace around commas is trimmed: ' Todo , Done ' works."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
-        mock_cached_projects.return_value = [
-            _make_project_dict("proj-1", "FE", "Frontend"),
-        ]
-        mock_cached_work_items.return_value = [
-            _make_work_item_dict("wi-1", "Todo task", 1, state="s-todo"),
-            _make_work_item_dict("wi-2", "Done task", 2, state="s-done"),
-            _make_work_item_dict("wi-3", "Progress task", 3, state="s-progress"),
-        ]
-        mock_cached_states.return_value = [
-            _make_state_dict("s-todo", "Todo"),
-            _make_state_dict("s-done", "Done"),
-            _make_state_dict("s-progress", "In Progress"),
-        ]
-        mock_cached_labels.return_value = []
-
-        await list_(state=" Todo , Done ")
-
-        data = mock_output.call_args[0][0]
-        assert len(data) == 2
-        names = {d["name"] for d in data}
-        assert names == {"Todo task", "Done task"}
-
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_filter_labels_no_match(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
-        """--labels 'nonexistent' returns empty result."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
-        mock_cached_projects.return_value = [
-            _make_project_dict("proj-1", "FE", "Frontend"),
-        ]
-        mock_cached_work_items.return_value = [
-            _make_work_item_dict("wi-1", "Bug task", 1, labels=["lbl-bug"]),
-        ]
-        mock_cached_states.return_value = []
-        mock_cached_labels.return_value = [
-            _make_label_dict("lbl-bug", "bug"),
-        ]
-
-        await list_(labels="nonexistent")
-
-        data = mock_output.call_args[0][0]
-        assert len(data) == 0
-
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.commands.work_items.resolve_project_async")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_single_project_propagates_error(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_resolve_project,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-    ):
+    async def test_list_single_project_propagates_error(self):
         """wi ls -p X must raise on API failure, not silently return an empty list."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
-        mock_resolve_project.return_value = _make_project_dict("proj-1", "FE", "Frontend")
+        self.mocks.resolve_project.return_value = _make_project_dict("proj-1", "FE", "Frontend")
 
         # The project's data fetch fails (e.g. auth/network error surfaced by the SDK).
-        mock_cached_work_items.side_effect = _make_http_error(401, "unauthorized")
-        mock_cached_states.return_value = []
-        mock_cached_labels.return_value = []
+        self.mocks.cached_work_items.side_effect = _make_http_error(401, "unauthorized")
 
         # PlaneError is converted to a PlaneCLIError with the right exit code; the old
         # behaviour swallowed it and returned [] (exit 0), masking the failure.
-        from planecli.exceptions import AuthenticationError
-
         with pytest.raises(AuthenticationError):
             await list_(project="Frontend")
 
-        mock_output.assert_not_called()
+        self.mocks.output.assert_not_called()
 
     @patch("planecli.formatters.console")
-    @patch("planecli.commands.work_items.output")
-    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
-    @patch("planecli.commands.work_items.get_client")
-    @patch("planecli.commands.work_items.create_client")
-    @patch("planecli.cache.cached_list_work_items", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
-    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
-    async def test_list_all_projects_warns_and_continues_on_error(
-        self,
-        mock_cached_labels,
-        mock_cached_states,
-        mock_cached_projects,
-        mock_cached_members,
-        mock_cached_work_items,
-        mock_create_client,
-        mock_get_client,
-        mock_get_ws,
-        mock_output,
-        mock_console,
-    ):
+    async def test_list_all_projects_warns_and_continues_on_error(self, mock_console):
         """wi ls (multi-project) warns on a failing project but keeps the others."""
-        mock_get_client.return_value = MagicMock()
-        mock_create_client.return_value = MagicMock()
-        mock_cached_members.return_value = []
 
-        mock_cached_projects.return_value = [
+        self.mocks.cached_projects.return_value = [
             _make_project_dict("proj-1", "FE", "Frontend"),
             _make_project_dict("proj-2", "BE", "Backend"),
         ]
@@ -1006,14 +405,12 @@ class TestWiList:
                 raise _make_http_error(500, "boom")
             return [_make_work_item_dict("wi-2", "BE task", 5)]
 
-        mock_cached_work_items.side_effect = _wi_side_effect
-        mock_cached_states.return_value = []
-        mock_cached_labels.return_value = []
+        self.mocks.cached_work_items.side_effect = _wi_side_effect
 
         await list_()
 
         # Backend items still shown; Frontend surfaced as a warning, not a hard failure.
-        data = mock_output.call_args[0][0]
+        data = self.mocks.output.call_args[0][0]
         assert len(data) == 1
         assert data[0]["project_identifier"] == "BE"
 
@@ -1044,18 +441,16 @@ class TestWiCreate:
         mock_output,
     ):
         """--estimate should resolve to estimate_point UUID via resolver."""
-        mock_get_client.return_value = MagicMock()
         mock_resolve_proj.return_value = "proj-1"
         mock_resolve_ep.return_value = {"id": "ep-uuid-5", "value": "5"}
 
-        mock_item = MagicMock()
-        mock_item.model_dump.return_value = {
+        mock_item = _make_sdk_model({
             "id": "wi-1",
             "name": "Test item",
             "sequence_id": 1,
             "priority": "medium",
             "estimate_point": "ep-uuid-5",
-        }
+        })
         mock_run_sdk.return_value = mock_item
 
         await create("Test item", project="Frontend", estimate=5)
@@ -1087,18 +482,16 @@ class TestWiUpdate:
         mock_output,
     ):
         """--estimate should resolve to estimate_point UUID via resolver."""
-        mock_get_client.return_value = MagicMock()
         mock_resolve_wi.return_value = ({"id": "wi-1", "name": "Test"}, "proj-1")
         mock_resolve_ep.return_value = {"id": "ep-uuid-8", "value": "8"}
 
-        mock_updated = MagicMock()
-        mock_updated.model_dump.return_value = {
+        mock_updated = _make_sdk_model({
             "id": "wi-1",
             "name": "Test",
             "sequence_id": 1,
             "priority": "medium",
             "estimate_point": "ep-uuid-8",
-        }
+        })
         mock_run_sdk.return_value = mock_updated
 
         await update("WI-1", estimate=8)
@@ -1124,16 +517,14 @@ class TestWiUpdate:
         mock_output,
     ):
         """Omitting --estimate should not set estimate_point on the update data."""
-        mock_get_client.return_value = MagicMock()
         mock_resolve_wi.return_value = ({"id": "wi-1", "name": "Test"}, "proj-1")
 
-        mock_updated = MagicMock()
-        mock_updated.model_dump.return_value = {
+        mock_updated = _make_sdk_model({
             "id": "wi-1",
             "name": "Test",
             "sequence_id": 1,
             "priority": "medium",
-        }
+        })
         mock_run_sdk.return_value = mock_updated
 
         await update("WI-1", name="New title")
@@ -1142,6 +533,82 @@ class TestWiUpdate:
         update_data = call_args[0][4]
         assert update_data.estimate_point is None
 
+    @patch("planecli.commands.work_items.output_single")
+    @patch("planecli.commands.work_items.run_sdk", new_callable=AsyncMock)
+    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
+    @patch("planecli.commands.work_items.get_client")
+    @patch("planecli.commands.work_items._resolve_project_id_async", new_callable=AsyncMock)
+    @patch(
+        "planecli.commands.work_items.resolve_work_item_across_projects_async",
+        new_callable=AsyncMock,
+    )
+    @patch("planecli.cache.invalidate_resource", new_callable=AsyncMock)
+    async def test_update_identifier_skips_project_resolution(
+        self,
+        mock_invalidate,
+        mock_resolve_wi,
+        mock_resolve_proj,
+        mock_get_client,
+        mock_get_ws,
+        mock_run_sdk,
+        mock_output,
+    ):
+        """An ABC-123 identifier already carries its project; --project is not resolved."""
+        mock_resolve_wi.return_value = ({"id": "wi-1", "name": "Test"}, "proj-1")
+        mock_run_sdk.return_value = _make_sdk_model(
+            {"id": "wi-1", "name": "Renamed", "sequence_id": 1}
+        )
+
+        await update("WI-1", project="Frontend", name="Renamed")
+
+        mock_resolve_proj.assert_not_awaited()
+        assert mock_run_sdk.call_args[0][2] == "proj-1"
+
+
+class TestWiSearch:
+    """Tests for the wi search command."""
+
+    @patch("planecli.commands.work_items.output")
+    @patch("planecli.commands.work_items.run_sdk", new_callable=AsyncMock)
+    @patch("planecli.commands.work_items.get_workspace", return_value="test-ws")
+    @patch("planecli.commands.work_items.get_client")
+    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
+    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
+    async def test_search_reads_issues_and_project_identifier(
+        self,
+        mock_cached_states,
+        mock_cached_members,
+        mock_get_client,
+        mock_get_ws,
+        mock_run_sdk,
+        mock_output,
+    ):
+        """Hits from the SDK's 'issues' key render as PROJ-N without extra lookups."""
+        from plane.models.work_items import WorkItemSearch, WorkItemSearchItem
+
+        from planecli.commands.work_items import search
+
+        mock_run_sdk.return_value = WorkItemSearch(
+            issues=[
+                WorkItemSearchItem(
+                    id="wi-1", name="Fix login", sequence_id="1",
+                    project__identifier="FE", project_id="proj-1", workspace__slug="test-ws",
+                ),
+                WorkItemSearchItem(
+                    id="wi-2", name="Fix API", sequence_id="2",
+                    project__identifier="BE", project_id="proj-2", workspace__slug="test-ws",
+                ),
+            ]
+        )
+
+        await search("fix")
+
+        data = mock_output.call_args[0][0]
+        assert [d["sequence_id"] for d in data] == ["FE-1", "BE-2"]
+        assert [d["name"] for d in data] == ["Fix login", "Fix API"]
+        mock_cached_members.assert_not_awaited()
+        mock_cached_states.assert_not_awaited()
+
 
 class TestWiFields:
     """Tests for display field configuration."""
@@ -1174,6 +641,41 @@ class TestWiFields:
         result = _enrich_work_item(data)
         assert result["estimate_display"] == ""
 
+    def test_enrich_assignee_names(self):
+        """Assignees resolve via expanded objects, the member map, or a truncated UUID."""
+        member_map = {"user-1": "Patrick Alves"}
+        data = {"assignees": [{"display_name": "Ana"}, "user-1", "abcdef0123456789"]}
+        result = _enrich_work_item(data, member_map=member_map)
+        assert result["assignee_names"] == "Ana, Patrick Alves, abcdef01"
+
+    def test_state_map_precomputes_display_color(self):
+        """Unstarted states are lightened once when the map is built."""
+        from planecli.commands.work_items import _build_state_map
+        from planecli.utils.colors import lighten_hex
+
+        state_map = _build_state_map([
+            {"id": "s-1", "name": "Todo", "color": "#3a3a3a", "group": "unstarted"},
+            {"id": "s-2", "name": "Backlog", "color": "#3a3a3a", "group": "backlog"},
+        ])
+        assert state_map["s-1"]["display_color"] == lighten_hex("#3a3a3a")
+        assert state_map["s-2"]["display_color"] == "#3a3a3a"
+
+        result = _enrich_work_item({"state": "s-1"}, state_map=state_map)
+        assert result["state_detail_name"].plain == "Todo"
+        assert str(result["state_detail_name"].style) == lighten_hex("#3a3a3a")
+
+    def test_enrich_label_names_keep_colors(self):
+        """Labels join into one comma-separated Text, keeping each label's color."""
+        label_map = {
+            "l-1": {"name": "bug", "color": "#ff0000"},
+            "l-2": {"name": "ui", "color": None},
+        }
+        data = {"labels": ["l-1", "l-2", "l-unknown"]}
+        result = _enrich_work_item(data, label_map=label_map)
+        assert result["label_names"].plain == "bug, ui, l-unknown"
+        assert [str(s.style) for s in result["label_names"].spans] == ["#ff0000"]
+        assert result["label_detail_names"] == ["bug", "ui", "l-unknown"]
+
 
 class TestWiShow:
     """Tests for the wi show command (with bundled comments)."""
@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
-from planecli.config import _read_config_file, load_config, save_config
+from planecli.config import _parse_config_text, _read_config_file, load_config, save_config
 from planecli.exceptions import AuthenticationError
 
 
@@ -16,30 +16,28 @@ class TestReadConfigFile:
             result = _read_config_file()
         assert result == {}
 
-    def test_parses_key_value_pairs(self, tmp_path):
-        config_file = tmp_path / ".plane_api"
-        config_file.write_text("base_url=https://api.plane.so\napi_key=secret\nworkspace=my-ws\n")
-        with patch("planecli.config.CONFIG_FILE", config_file):
-            result = _read_config_file()
-        assert result == {
-            "base_url": "https://api.plane.so",
-            "api_key": "secret",
-            "workspace": "my-ws",
-        }
-
-    def test_ignores_comments_and_empty_lines(self, tmp_path):
-        config_file = tmp_path / ".plane_api"
-        config_file.write_text("# comment\n\nbase_url=https://example.com\n")
-        with patch("planecli.config.CONFIG_FILE", config_file):
-            result = _read_config_file()
-        assert result == {"base_url": "https://example.com"}
-
-    def test_strips_quotes(self, tmp_path):
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            (
+                "base_url=https://api.plane.so\napi_key=secret\nworkspace=my-ws\n",
+                {"base_url": "https://api.plane.so", "api_key": "secret", "workspace": "my-ws"},
+            ),
+            ("# comment\n\nbase_url=https://example.com\n", {"base_url": "https://example.com"}),
+            ('api_key="my-secret"\n', {"api_key": "my-secret"}),
+            ("  API_KEY = 'abc=def#1' \r\nno separator here\n", {"api_key": "abc=def#1"}),
+        ],
+        ids=["key-value-pairs", "comments-and-blank-lines", "strips-quotes", "value-separators"],
+    )
+    def test_parses_config_text(self, content, expected):
+        assert _parse_config_text(content) == expected
+
+    def test_reads_config_file(self, tmp_path):
         config_file = tmp_path / ".plane_api"
-        config_file.write_text('api_key="my-secret"\n')
+        config_file.write_text("base_url=https://example.com\r\napi_key=secret\n")
         with patch("planecli.config.CONFIG_FILE", config_file):
             result = _read_config_file()
-        assert result == {"api_key": "my-secret"}
+        assert result == {"base_url": "https://example.com", "api_key": "secret"}
 
 
 class TestSaveConfig:
@@ -59,14 +57,25 @@ class TestSaveConfig:
         assert mode == 0o600
 
 
+@pytest.fixture
+def clean_plane_env(monkeypatch):
+    """Unset the PLANE_* variables load_config reads; return monkeypatch for setenv."""
+    for name in ("PLANE_BASE_URL", "PLANE_API_KEY", "PLANE_WORKSPACE"):
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture(scope="class")
+def config_file_with_values(tmp_path_factory):
+    """A read-only ~/.plane_api stand-in where every field is "file"."""
+    config_file = tmp_path_factory.mktemp("cfg") / ".plane_api"
+    config_file.write_text("base_url=file\napi_key=file\nworkspace=file\n")
+    return config_file
+
+
 class TestLoadConfig:
-    def test_explicit_args_take_precedence(self, tmp_path):
-        config_file = tmp_path / ".plane_api"
-        config_file.write_text("base_url=file\napi_key=file\nworkspace=file\n")
-        with (
-            patch("planecli.config.CONFIG_FILE", config_file),
-            patch.dict("os.environ", {}, clear=True),
-        ):
+    def test_explicit_args_take_precedence(self, config_file_with_values, clean_plane_env):
+        with patch("planecli.config.CONFIG_FILE", config_file_with_values):
             config = load_config(
                 base_url="explicit",
                 api_key="explicit",
@@ -76,51 +85,40 @@ class TestLoadConfig:
         assert config.api_key == "explicit"
         assert config.workspace == "explicit"
 
-    def test_env_vars_override_file(self, tmp_path):
-        config_file = tmp_path / ".plane_api"
-        config_file.write_text("base_url=file\napi_key=file\nworkspace=file\n")
-        env = {
-            "PLANE_BASE_URL": "env-url",
-            "PLANE_API_KEY": "env-key",
-            "PLANE_WORKSPACE": "env-ws",
-        }
-        with (
-            patch("planecli.config.CONFIG_FILE", config_file),
-            patch.dict("os.environ", env, clear=True),
-        ):
+    def test_env_vars_override_file(self, config_file_with_values, clean_plane_env):
+        clean_plane_env.setenv("PLANE_BASE_URL", "env-url")
+        clean_plane_env.setenv("PLANE_API_KEY", "env-key")
+        clean_plane_env.setenv("PLANE_WORKSPACE", "env-ws")
+        with patch("planecli.config.CONFIG_FILE", config_file_with_values):
             config = load_config()
         assert config.base_url == "env-url"
         assert config.api_key == "env-key"
         assert config.workspace == "env-ws"
 
-    def test_raises_when_missing_base_url(self, tmp_path):
-        with (
-            patch("planecli.config.CONFIG_FILE", tmp_path / "nonexistent"),
-            patch.dict("os.environ", {}, clear=True),
-        ):
+    def test_skips_file_when_env_is_complete(self, clean_plane_env):
+        clean_plane_env.setenv("PLANE_BASE_URL", "env-url")
+        clean_plane_env.setenv("PLANE_API_KEY", "env-key")
+        clean_plane_env.setenv("PLANE_WORKSPACE", "env-ws")
+        with patch("planecli.config._read_config_file") as mock_read:
+            config = load_config()
+        mock_read.assert_not_called()
+        assert config.base_url == "env-url"
+
+    def test_raises_when_missing_base_url(self, tmp_path, clean_plane_env):
+        with patch("planecli.config.CONFIG_FILE", tmp_path / "nonexistent"):
             with pytest.raises(AuthenticationError, match="Missing base URL"):
                 load_config()
 
-    def test_raises_when_missing_api_key(self, tmp_path):
-        with (
-            patch("planecli.config.CONFIG_FILE", tmp_path / "nonexistent"),
-            patch.dict("os.environ", {"PLANE_BASE_URL": "url"}, clear=True),
-        ):
+    def test_raises_when_missing_api_key(self, tmp_path, clean_plane_env):
+        clean_plane_env.setenv("PLANE_BASE_URL", "url")
+        with patch("planecli.config.CONFIG_FILE", tmp_path / "nonexistent"):
             with pytest.raises(AuthenticationError, match="Missing API key"):
                 load_config()
 
-    def test_strips_trailing_slash(self, tmp_path):
-        with (
-            patch("planecli.config.CONFIG_FILE", tmp_path / "nonexistent"),
-            patch.dict(
-                "os.environ",
-                {
-                    "PLANE_BASE_URL": "https://api.plane.so/",
-                    "PLANE_API_KEY": "key",
-                    "PLANE_WORKSPACE": "ws",
-                },
-                clear=True,
-            ),
-        ):
+    def test_strips_trailing_slash(self, tmp_path, clean_plane_env):
+        clean_plane_env.setenv("PLANE_BASE_URL", "https://api.plane.so/")
+        clean_plane_env.setenv("PLANE_API_KEY", "key")
+        clean_plane_env.setenv("PLANE_WORKSPACE", "ws")
+        with patch("planecli.config.CONFIG_FILE", tmp_path / "nonexistent"):
             config = load_config()
         assert config.base_url == "https://api.plane.so"
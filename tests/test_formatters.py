@@ -0,0 +1,91 @@
+"""Tests for output formatters."""
+
+from __future__ import annotations
+
+import io
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from rich.text import Text
+
+import planecli.formatters as formatters
+from planecli.formatters import _format_value, _write_json
+
+SAMPLE = [
+    {
+        "id": "wi-1",
+        "name": "Ação — ✓",
+        "sequence_id": 7,
+        "estimate": 1.5,
+        "labels": [],
+        "meta": {},
+        "parent": None,
+        "is_draft": False,
+        "state_detail_name": Text("In Progress", style="bold"),
+        "created_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    }
+]
+
+
+def _capture(data) -> str:
+    buf = io.StringIO()
+    with patch("sys.stdout", buf):
+        _write_json(data)
+    return buf.getvalue()
+
+
+class TestWriteJson:
+    def test_stdlib_output(self):
+        with patch.object(formatters, "orjson", None):
+            out = _capture(SAMPLE)
+        assert out == json.dumps(SAMPLE, indent=2, default=str, ensure_ascii=False) + "\n"
+
+    def test_orjson_matches_stdlib(self):
+        pytest.importorskip("orjson")
+        fast = _capture(SAMPLE)
+        with patch.object(formatters, "orjson", None):
+            slow = _capture(SAMPLE)
+        assert fast == slow
+
+    def test_non_string_keys_match_stdlib(self):
+        pytest.importorskip("orjson")
+        data = {1: "a", None: "b"}
+        fast = _capture(data)
+        with patch.object(formatters, "orjson", None):
+            slow = _capture(data)
+        assert fast == slow
+
+    def test_orjson_documented_differences(self):
+        pytest.importorskip("orjson")
+        data = {"nan": float("nan"), "inf": float("inf"), "small": 1e-7}
+        assert json.loads(_capture(data)) == {"nan": None, "inf": None, "small": 1e-7}
+        with patch.object(formatters, "orjson", None):
+            assert '"small": 1e-07' in _capture(data)
+
+    def test_orjson_writes_bytes_to_binary_stdout(self):
+        pytest.importorskip("orjson")
+        raw = io.BytesIO()
+        stdout = io.TextIOWrapper(raw, encoding="utf-8")
+        with patch("sys.stdout", stdout):
+            print("before", flush=False)
+            _write_json({"name": "Ação"})
+        assert raw.getvalue().decode() == 'before\n{\n  "name": "Ação"\n}\n'
+
+
+class TestFormatValue:
+    def test_timestamp_with_microseconds(self):
+        assert _format_value("2026-02-08T12:26:34.340901Z") == "2026-02-08 12:26:34"
+
+    def test_timestamp_without_fraction(self):
+        assert _format_value("2026-02-08T12:26:34Z") == "2026-02-08 12:26:34"
+
+    def test_plain_values(self):
+        assert _format_value("Todo") == "Todo"
+        assert _format_value(42) == "42"
+        assert _format_value(None) == ""
+
+    def test_text_passes_through(self):
+        text = Text("Urgent", style="red")
+        assert _format_value(text) is text
@@ -2,27 +2,32 @@
 
 from __future__ import annotations
 
-from planecli.utils.fuzzy import find_best_match, find_matches
+import pytest
+
+from planecli.utils.fuzzy import MIN_MATCH_SCORE, find_best_match, find_matches
+
+ITEMS = ("Frontend App", "Backend API", "Mobile")
 
 
 class TestFindBestMatch:
-    def test_exact_match(self):
-        items = ["Frontend App", "Backend API", "Mobile"]
-        result = find_best_match("Frontend App", items, key=lambda x: x)
-        assert result is not None
-        assert result.item == "Frontend App"
-        assert result.score == 100.0
+    @pytest.mark.parametrize(
+        ("query", "threshold", "expected"),
+        [
+            ("Frontend App", MIN_MATCH_SCORE, "Frontend App"),
+            ("frontend", MIN_MATCH_SCORE, "Frontend App"),
+            ("zzzzzzzzz", MIN_MATCH_SCORE, None),
+            ("Fron", 90, None),
+        ],
+        ids=["exact", "fuzzy", "below-threshold", "custom-threshold"],
+    )
+    def test_string_items(self, query, threshold, expected):
+        result = find_best_match(query, ITEMS, key=lambda x: x, threshold=threshold)
+        assert (result.item if result else None) == expected
 
-    def test_fuzzy_match(self):
-        items = ["Frontend App", "Backend API", "Mobile"]
-        result = find_best_match("frontend", items, key=lambda x: x)
+    def test_exact_match_scores_100(self):
+        result = find_best_match("Frontend App", ITEMS, key=lambda x: x)
         assert result is not None
-        assert result.item == "Frontend App"
-
-    def test_no_match_below_threshold(self):
-        items = ["Frontend App", "Backend API"]
-        result = find_best_match("zzzzzzzzz", items, key=lambda x: x)
-        assert result is None
+        assert result.score == 100.0
 
     def test_empty_items(self):
         result = find_best_match("query", [], key=lambda x: x)
@@ -37,10 +42,18 @@ class TestFindBestMatch:
         assert result is not None
         assert result.item["id"] == "2"
 
-    def test_custom_threshold(self):
-        items = ["Frontend App"]
-        result = find_best_match("Fron", items, key=lambda x: x, threshold=90)
-        assert result is None
+    def test_exact_match_beats_earlier_token_equivalent(self):
+        items = ["Review In", "In Review"]
+        result = find_best_match("in review", items, key=lambda x: x)
+        assert result is not None
+        assert result.item == "In Review"
+        assert result.score == 100.0
+
+    def test_tie_returns_first_item(self):
+        items = [{"name": "Bug", "id": "1"}, {"name": "bug", "id": "2"}]
+        result = find_best_match("BUG", items, key=lambda x: x["name"])
+        assert result is not None
+        assert result.item["id"] == "1"
 
 
 class TestFindMatches:
@@ -58,3 +71,8 @@ class TestFindMatches:
     def test_empty_items(self):
         results = find_matches("query", [], key=lambda x: x)
         assert results == []
+
+    def test_ties_keep_original_order(self):
+        items = ["Frontend B", "Frontend A", "Front", "B Frontend"]
+        results = find_matches("frontend b", items, key=lambda x: x, threshold=0)
+        assert [m.matched_value for m in results[:2]] == ["Frontend B", "B Frontend"]
@@ -0,0 +1,29 @@
+"""Tests for HTML helpers."""
+
+from __future__ import annotations
+
+from planecli.utils.html import strip_html
+
+
+class TestStripHtml:
+    def test_removes_tags(self):
+        assert strip_html("<p>Hello <strong>world</strong></p>") == "Hello world"
+
+    def test_strips_surrounding_whitespace(self):
+        assert strip_html("  <p> padded </p>\n") == "padded"
+
+    def test_plain_text_unchanged(self):
+        assert strip_html("no markup here") == "no markup here"
+
+    def test_plain_text_is_stripped(self):
+        assert strip_html("  plain  \n") == "plain"
+
+    def test_whitespace_only(self):
+        assert strip_html("   ") == ""
+
+    def test_keeps_unclosed_angle_bracket(self):
+        assert strip_html("a < b") == "a < b"
+
+    def test_long_description(self):
+        html = "<p>line <em>one</em></p>" * 5000
+        assert strip_html(html) == "line one" * 5000
@@ -2,49 +2,266 @@
 
 from __future__ import annotations
 
-from planecli.utils.resolve import ISSUE_ID_PATTERN, _is_uuid
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from plane.errors import HttpError
+
+from planecli.exceptions import ResourceNotFoundError
+from planecli.utils.resolve import (
+    ISSUE_ID_PATTERN,
+    _is_uuid,
+    _match_name_paged,
+    resolve_labels_async,
+    resolve_project,
+    resolve_project_async,
+    resolve_state_async,
+    resolve_user_async,
+    resolve_work_item_across_projects,
+    resolve_work_item_across_projects_async,
+)
+from tests.conftest import make_page
 
 
 class TestIsUUID:
-    def test_valid_uuid(self):
-        assert _is_uuid("550e8400-e29b-41d4-a716-446655440000")
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "550e8400-e29b-41d4-a716-446655440000",
+            "550E8400-E29B-41D4-A716-446655440000",
+        ],
+        ids=["lowercase", "uppercase"],
+    )
+    def test_valid_uuid(self, value):
+        assert _is_uuid(value)
 
-    def test_uppercase_uuid(self):
-        assert _is_uuid("550E8400-E29B-41D4-A716-446655440000")
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "not-a-uuid",
+            "",
+            "550e8400-e29b",
+            "550e8400-e29b-41d4-a716-446655440000\n",
+        ],
+        ids=["not-a-uuid", "empty", "partial", "trailing-newline"],
+    )
+    def test_invalid_uuid(self, value):
+        assert not _is_uuid(value)
 
-    def test_invalid_uuid(self):
-        assert not _is_uuid("not-a-uuid")
 
-    def test_empty_string(self):
-        assert not _is_uuid("")
+class TestIssueIdPattern:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("ABC-123", ("ABC", "123")),
+            ("abc-456", ("abc", "456")),
+            ("A-1", ("A", "1")),
+            ("ABC-", None),
+            ("-123", None),
+            ("A1B-123", None),
+            ("ABC-123x", None),
+        ],
+        ids=[
+            "standard",
+            "lowercase",
+            "single-letter",
+            "no-number",
+            "no-prefix",
+            "digits-in-prefix",
+            "trailing-text",
+        ],
+    )
+    def test_pattern(self, value, expected):
+        match = ISSUE_ID_PATTERN.match(value)
+        assert (match.groups() if match else None) == expected
 
-    def test_partial_uuid(self):
-        assert not _is_uuid("550e8400-e29b")
 
+class TestResolveLabelsAsync:
+    LABELS = [
+        {"id": "lbl-bug", "name": "bug"},
+        {"id": "lbl-fe", "name": "frontend"},
+    ]
 
-class TestIssueIdPattern:
-    def test_standard_id(self):
-        match = ISSUE_ID_PATTERN.match("ABC-123")
-        assert match is not None
-        assert match.group(1) == "ABC"
-        assert match.group(2) == "123"
+    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
+    async def test_fetches_labels_once_and_keeps_order(self, mock_cached_labels):
+        mock_cached_labels.return_value = self.LABELS
 
-    def test_lowercase_id(self):
-        match = ISSUE_ID_PATTERN.match("abc-456")
-        assert match is not None
+        result = await resolve_labels_async(["frontend", "bug"], MagicMock(), "ws", "proj-1")
+
+        assert [lb["id"] for lb in result] == ["lbl-fe", "lbl-bug"]
+        mock_cached_labels.assert_awaited_once_with("ws", "proj-1")
+
+    @patch("planecli.cache.cached_list_labels", new_callable=AsyncMock)
+    async def test_unknown_label_raises(self, mock_cached_labels):
+        mock_cached_labels.return_value = self.LABELS
+
+        with pytest.raises(ResourceNotFoundError):
+            await resolve_labels_async(["bug", "zzzzzz"], MagicMock(), "ws", "proj-1")
+
+
+class TestResolveUserAsync:
+    @patch("planecli.cache.cached_list_members", new_callable=AsyncMock)
+    async def test_email_match_skips_members_without_email(self, mock_cached_members):
+        mock_cached_members.return_value = [
+            {"id": "user-1", "email": None, "display_name": "Bot"},
+            {"id": "user-2", "email": "Pat@Example.com", "display_name": "Patrick"},
+        ]
+
+        result = await resolve_user_async("pat@example.com", MagicMock(), "ws")
+
+        assert result["id"] == "user-2"
+
+
+class TestResolveProject:
+    def test_identifier_match_stops_paginating(self):
+        first = SimpleNamespace(identifier="WEB", name="Website", model_dump=lambda: {"id": "p-1"})
+        later = SimpleNamespace(identifier="API", name="Backend", model_dump=lambda: {"id": "p-2"})
+        client = MagicMock()
+        client.projects.list.side_effect = [
+            make_page([first], next_cursor="c0"),
+            make_page([later]),
+        ]
+
+        assert resolve_project("web", client, "ws") == {"id": "p-1"}
+        assert client.projects.list.call_count == 1
+
+
+class TestResolveProjectAsync:
+    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
+    async def test_identifier_match_skips_projects_without_identifier(self, mock_cached_projects):
+        mock_cached_projects.return_value = [
+            {"id": "proj-1", "identifier": None, "name": "Archive"},
+            {"id": "proj-2", "identifier": "FE", "name": "Frontend"},
+        ]
+
+        result = await resolve_project_async("fe", MagicMock(), "ws")
+
+        assert result["id"] == "proj-2"
+
+
+class TestResolveStateAsync:
+    @patch("planecli.cache.cached_list_states", new_callable=AsyncMock)
+    async def test_fuzzy_name_match(self, mock_cached_states):
+        mock_cached_states.return_value = [{"id": "s-1", "name": "In Progress"}]
+
+        state = await resolve_state_async("in progres", MagicMock(), "ws", "proj-1")
+
+        assert state["id"] == "s-1"
+        mock_cached_states.assert_awaited_once_with("ws", "proj-1")
+
+    @patch("planecli.api.async_sdk.run_sdk", new_callable=AsyncMock)
+    async def test_unknown_uuid_raises_not_found(self, mock_run_sdk):
+        mock_run_sdk.side_effect = HttpError("Not found", status_code=404)
+
+        with pytest.raises(ResourceNotFoundError, match="State"):
+            await resolve_state_async(
+                "550e8400-e29b-41d4-a716-446655440000", MagicMock(), "ws", "proj-1"
+            )
+
+
+class TestResolveWorkItemAcrossProjects:
+    UUID = "550e8400-e29b-41d4-a716-446655440000"
+
+    @staticmethod
+    def _get_from(owner: str):
+        def _get(path: str):
+            if f"/projects/{owner}/" in path:
+                return {"id": "wi-1", "name": "Found"}
+            raise HttpError("Not found", status_code=404)
+
+        return _get
+
+    @patch("planecli.utils.resolve._paginate_all")
+    def test_uuid_probes_every_project(self, mock_paginate):
+        mock_paginate.return_value = [SimpleNamespace(id=f"proj-{n}") for n in range(6)]
+        client = MagicMock()
+        client.work_items._get.side_effect = self._get_from("proj-4")
+
+        item, project_id = resolve_work_item_across_projects(self.UUID, client, "ws")
+
+        assert item["name"] == "Found"
+        assert project_id == "proj-4"
+
+    @patch("planecli.utils.resolve._paginate_all")
+    def test_uuid_not_found_in_any_project(self, mock_paginate):
+        mock_paginate.return_value = [SimpleNamespace(id="proj-1"), SimpleNamespace(id="proj-2")]
+        client = MagicMock()
+        client.work_items._get.side_effect = self._get_from("proj-9")
+
+        with pytest.raises(ResourceNotFoundError):
+            resolve_work_item_across_projects(self.UUID, client, "ws")
+
+    @patch("planecli.utils.resolve._paginate_all")
+    def test_uuid_retryable_error_propagates(self, mock_paginate):
+        mock_paginate.return_value = [SimpleNamespace(id="proj-1")]
+        client = MagicMock()
+        client.work_items._get.side_effect = HttpError("Rate limited", status_code=429)
+
+        with pytest.raises(HttpError):
+            resolve_work_item_across_projects(self.UUID, client, "ws")
+
+    @patch("planecli.api.async_sdk.run_sdk")
+    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
+    async def test_async_uuid_cancels_pending_probes_on_hit(
+        self, mock_cached_projects, mock_run_sdk
+    ):
+        mock_cached_projects.return_value = [{"id": "proj-slow"}, {"id": "proj-hit"}]
+        cancelled = asyncio.Event()
+
+        async def _run_sdk(fn, path):
+            if "/projects/proj-hit/" in path:
+                return {"id": "wi-1", "name": "Found"}
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_run_sdk.side_effect = _run_sdk
+
+        item, project_id = await resolve_work_item_across_projects_async(
+            self.UUID, MagicMock(), "ws"
+        )
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        assert item["name"] == "Found"
+        assert project_id == "proj-hit"
+
+    @patch("planecli.api.async_sdk.run_sdk")
+    @patch("planecli.cache.cached_list_projects", new_callable=AsyncMock)
+    async def test_async_uuid_not_found_in_any_project(self, mock_cached_projects, mock_run_sdk):
+        mock_cached_projects.return_value = [{"id": "proj-1"}, {"id": "proj-2"}]
+        mock_run_sdk.side_effect = HttpError("Not found", status_code=404)
+
+        with pytest.raises(ResourceNotFoundError):
+            await resolve_work_item_across_projects_async(self.UUID, MagicMock(), "ws")
+
+
+class TestMatchNamePaged:
+    @staticmethod
+    def _pages(*pages):
+        responses = [
+            make_page(list(page), next_cursor=f"c{n}" if n < len(pages) - 1 else None)
+            for n, page in enumerate(pages)
+        ]
+        return MagicMock(side_effect=responses)
+
+    def test_exact_name_stops_paginating(self):
+        list_fn = self._pages(["Fix login", "Add search"], ["Fix logout"])
+
+        match = _match_name_paged("add SEARCH", list_fn, key=lambda x: x)
 
-    def test_single_letter(self):
-        match = ISSUE_ID_PATTERN.match("A-1")
         assert match is not None
+        assert match.item == "Add search"
+        assert list_fn.call_count == 1
 
-    def test_invalid_no_number(self):
-        match = ISSUE_ID_PATTERN.match("ABC-")
-        assert match is None
+    def test_fuzzy_match_reads_every_page(self):
+        list_fn = self._pages(["Fix login"], ["Fix logout button"])
 
-    def test_invalid_no_prefix(self):
-        match = ISSUE_ID_PATTERN.match("-123")
-        assert match is None
+        match = _match_name_paged("logout button", list_fn, key=lambda x: x)
 
-    def test_invalid_numbers_in_prefix(self):
-        match = ISSUE_ID_PATTERN.match("A1B-123")
-        assert match is None
+        assert match is not None
+        assert match.item == "Fix logout button"
+        assert list_fn.call_count == 2
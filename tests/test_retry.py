@@ -2,23 +2,24 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from plane.errors import HttpError
 from tenacity import wait_none
 
-from planecli.api.async_sdk import run_sdk
+from planecli.api.async_sdk import api_concurrency, run_sdk
 from planecli.utils.resolve import _fetch_page, _paginate_all
+from tests.conftest import make_page
 
 
 def _make_http_error(status_code: int, message: str = "") -> HttpError:
     return HttpError(message or f"HTTP {status_code}", status_code=status_code)
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="module")
 def _fast_retry():
-    """Patch tenacity wait to zero for fast tests."""
+    """Patch tenacity wait to zero for fast tests (once for the whole module)."""
     original_wait = run_sdk.retry.wait
     original_page_wait = _fetch_page.retry.wait
     run_sdk.retry.wait = wait_none()
@@ -100,8 +101,8 @@ class TestPaginateAllRetry:
 
     def test_retries_single_page_429(self):
         """429 on a pagination page retries just that page."""
-        page1 = MagicMock(results=["a", "b"], next_page_results=True, next_cursor="c1")
-        page2_ok = MagicMock(results=["c"], next_page_results=False)
+        page1 = make_page(["a", "b"], next_cursor="c1")
+        page2_ok = make_page(["c"])
 
         list_fn = MagicMock(side_effect=[page1, _make_http_error(429), page2_ok])
         result = _paginate_all(list_fn)
@@ -118,8 +119,25 @@ class TestPaginateAllRetry:
 
     def test_single_page_no_retry_needed(self):
         """Normal pagination works without retry."""
-        page1 = MagicMock(results=["a", "b"], next_page_results=False)
+        page1 = make_page(["a", "b"])
         list_fn = MagicMock(side_effect=[page1])
         result = _paginate_all(list_fn)
         assert result == ["a", "b"]
         assert list_fn.call_count == 1
+
+
+class TestApiConcurrency:
+    """Test the PLANECLI_CONCURRENCY override for the API semaphore."""
+
+    def test_default_when_unset(self):
+        with patch.dict("os.environ", {}, clear=True):
+            assert api_concurrency() == 4
+
+    def test_reads_env_override(self):
+        with patch.dict("os.environ", {"PLANECLI_CONCURRENCY": "8"}):
+            assert api_concurrency() == 8
+
+    @pytest.mark.parametrize("raw", ["0", "-2", "many", ""])
+    def test_invalid_values_fall_back_to_default(self, raw):
+        with patch.dict("os.environ", {"PLANECLI_CONCURRENCY": raw}):
+            assert api_concurrency() == 4